@@ -5,7 +5,7 @@ import os
 import pathlib
 import shutil
 
-from typing_extensions import List, TYPE_CHECKING, Optional
+from typing_extensions import List, TYPE_CHECKING, Optional, Dict
 
 from .datastructures.dataclasses import Color
 from .ros.logging import loginfo
@@ -36,6 +36,14 @@ class CacheManager:
         """
         self.cache_dir = cache_dir
         self.data_directories = data_directory
+        self._data_file_paths: Optional[Dict[str, str]] = None
+        """
+        Index of the files in the data directories, mapping the file name to the path of the first file with that name.
+        """
+        self._indexed_data_directories: Optional[List[str]] = None
+        """
+        The data directories at the time the index was built.
+        """
         if clear_cache:
             self.clear_cache()
 
@@ -93,20 +101,38 @@ class CacheManager:
         """
         Look for a file in the data directory of the World. If the file is not found in the data directory, raise a
          FileNotFoundError.
+        The data directories are indexed on the first lookup and indexed again when the data directories changed or the
+        file is not (or no longer) where the index points, such that files added or moved later are still found.
 
         :param path_object: The pathlib object of the file to look for.
         """
         name = path_object.name
+        if (self._indexed_data_directories != self.data_directories or name not in self._data_file_paths
+                or not os.path.exists(self._data_file_paths[name])):
+            self._indexed_data_directories = list(self.data_directories)
+            self._data_file_paths = self.index_data_directories()
+        if name in self._data_file_paths:
+            file_path = self._data_file_paths[name]
+            loginfo(f"Found file {name} in {file_path}")
+            return file_path
+
+        raise FileNotFoundError(
+            f"File {name} could not be found in the resource directory {self.data_directories}")
+
+    def index_data_directories(self) -> Dict[str, str]:
+        """
+        Walk all data directories once and map every file name to its path, if multiple files have the same name the
+        first one found is used.
+
+        :return: The mapping from file names to file paths.
+        """
+        data_file_paths = {}
         for data_dir in self.data_directories:
             data_path = pathlib.Path(data_dir).joinpath("**")
             for file in glob.glob(str(data_path), recursive=True):
                 file_path = pathlib.Path(file)
-                if file_path.name == name:
-                    loginfo(f"Found file {name} in {file_path}")
-                    return str(file_path)
-
-        raise FileNotFoundError(
-            f"File {name} could not be found in the resource directory {self.data_directories}")
+                data_file_paths.setdefault(file_path.name, str(file_path))
+        return data_file_paths
 
     def create_cache_dir_if_not_exists(self):
         """
@@ -6,7 +6,6 @@ from copy import deepcopy, copy
 from dataclasses import dataclass, fields, field
 
 import numpy as np
-import trimesh
 from typing_extensions import List, Optional, Tuple, Callable, Dict, Any, Union, TYPE_CHECKING, Sequence
 
 from .enums import JointType, Shape, VirtualMobileBaseJointName
@@ -14,6 +13,7 @@ from .pose import Pose, Point, Transform
 from ..validation.error_checkers import calculate_joint_position_error, is_error_acceptable
 
 if TYPE_CHECKING:
+    from trimesh.parent import Geometry3D
     from ..description import Link
     from ..world_concepts.world_object import Object
     from ..world_concepts.constraints import Attachment
@@ -193,13 +193,12 @@ class AxisAlignedBoundingBox(BoundingBox):
 
         :param bounding_boxes: The list of axis-aligned bounding boxes.
         """
-        min_x = min([box.min_x for box in bounding_boxes])
-        min_y = min([box.min_y for box in bounding_boxes])
-        min_z = min([box.min_z for box in bounding_boxes])
-        max_x = max([box.max_x for box in bounding_boxes])
-        max_y = max([box.max_y for box in bounding_boxes])
-        max_z = max([box.max_z for box in bounding_boxes])
-        return cls(min_x, min_y, min_z, max_x, max_y, max_z)
+        extrema = np.empty((len(bounding_boxes), 6), dtype=np.float64)
+        for i, box in enumerate(bounding_boxes):
+            extrema[i] = (box.min_x, box.min_y, box.min_z, box.max_x, box.max_y, box.max_z)
+        min_point = extrema[:, :3].min(axis=0)
+        max_point = extrema[:, 3:].max(axis=0)
+        return cls.from_min_max(min_point.tolist(), max_point.tolist())
 
     def get_transformed_box(self, transform: Transform) -> AxisAlignedBoundingBox:
         """
@@ -209,8 +208,8 @@ class AxisAlignedBoundingBox(BoundingBox):
         :return: The transformed axis-aligned bounding box
         """
         transformed_points = transform.apply_transform_to_array_of_points(np.array(self.get_min_max()))
-        min_p = [min(transformed_points[:, i]) for i in range(3)]
-        max_p = [max(transformed_points[:, i]) for i in range(3)]
+        min_p = transformed_points.min(axis=0).tolist()
+        max_p = transformed_points.max(axis=0).tolist()
         return AxisAlignedBoundingBox.from_min_max(min_p, max_p)
 
     @classmethod
@@ -446,11 +445,20 @@ class MeshVisualShape(VisualShape):
         :param file_path: An alternative file path.
         :return: The axis-aligned bounding box of the mesh visual shape.
         """
+        from ..description import load_mesh
         mesh_file_path = file_path if file_path is not None else self.file_name
-        mesh = trimesh.load(mesh_file_path)
-        min_bound, max_bound = mesh.bounds
+        min_bound, max_bound = load_mesh(mesh_file_path).bounds
         return AxisAlignedBoundingBox.from_min_max(min_bound, max_bound)
 
+    def get_convex_hull(self, file_path: Optional[str] = None) -> Geometry3D:
+        """
+        :param file_path: An alternative file path.
+        :return: The convex hull of the mesh in the mesh frame. The hull is computed once per mesh file and shared, so
+         it should be copied before it is modified.
+        """
+        from ..description import get_mesh_convex_hull
+        return get_mesh_convex_hull(file_path if file_path is not None else self.file_name)
+
 
 @dataclass
 class PlaneVisualShape(VisualShape):
@@ -2,10 +2,10 @@
 
 from enum import Enum, auto
 
-from ..failures import UnsupportedJointType
+from typing_extensions import TypeAlias
 
 
-class ExecutionType(Enum):
+class ExecutionType(int, Enum):
     """Enum for Execution Process Module types."""
     REAL = auto()
     SIMULATED = auto()
@@ -29,7 +29,7 @@ class TaskStatus(int, Enum):
     FAILED = 3
 
 
-class JointType(Enum):
+class JointType(int, Enum):
     """
     Enum for readable joint types.
     """
@@ -84,7 +84,7 @@ class State(int, Enum):
     INTERRUPTED = 3
 
 
-class Shape(Enum):
+class Shape(int, Enum):
     """
     Enum for visual shapes of objects
     """
@@ -96,7 +96,7 @@ class Shape(Enum):
     CAPSULE = 7
 
 
-class TorsoState(Enum):
+class TorsoState(int, Enum):
     """
     Enum for the different states of the torso.
     """
@@ -105,7 +105,7 @@ class TorsoState(Enum):
     LOW = auto()
 
 
-class WorldMode(Enum):
+class WorldMode(str, Enum):
     """
     Enum for the different modes of the world.
     """
@@ -122,7 +122,7 @@ class AxisIdentifier(Enum):
     Z = (0, 0, 1)
 
 
-class GripperState(Enum):
+class GripperState(int, Enum):
     """
     Enum for the different motions of the gripper.
     """
@@ -130,7 +130,7 @@ class GripperState(Enum):
     CLOSE = auto()
 
 
-class GripperType(Enum):
+class GripperType(int, Enum):
     """
     Enum for the different types of grippers.
     """
@@ -189,7 +189,7 @@ class DetectionState(int, Enum):
     PAUSE = 2
 
 
-class LoggerLevel(Enum):
+class LoggerLevel(str, Enum):
     """
     Enum for the different logger levels.
     """
@@ -200,7 +200,7 @@ class LoggerLevel(Enum):
     FATAL = 'fatal'
 
 
-class VirtualMobileBaseJointName(Enum):
+class VirtualMobileBaseJointName(str, Enum):
     """
     Enum for the joint names of the virtual mobile base.
     """
@@ -209,7 +209,7 @@ class VirtualMobileBaseJointName(Enum):
     ANGULAR_Z = "odom_vel_ang_z_joint"
 
 
-class MJCFGeomType(Enum):
+class MJCFGeomType(str, Enum):
     """
     Enum for the different geom types in a MuJoCo XML file.
     """
@@ -224,13 +224,13 @@ class MJCFGeomType(Enum):
     SDF = "sdf"
 
 
-MJCFBodyType = MJCFGeomType
+MJCFBodyType: TypeAlias = MJCFGeomType
 """
 Alias for MJCFGeomType. As the body type is the same as the geom type.
 """
 
 
-class MJCFJointType(Enum):
+class MJCFJointType(str, Enum):
     """
     Enum for the different joint types in a MuJoCo XML file.
     """
@@ -241,7 +241,7 @@ class MJCFJointType(Enum):
     FIXED = "fixed"  # Added for compatibility with PyCRAM, but not a real joint type in MuJoCo.
 
 
-class MovementType(Enum):
+class MovementType(int, Enum):
     """
     Enum for the different movement types of the robot.
     """
@@ -251,7 +251,7 @@ class MovementType(Enum):
     CARTESIAN = auto()
 
 
-class MultiverseAPIName(Enum):
+class MultiverseAPIName(str, Enum):
     """
     Enum for the different APIs of the Multiverse.
     """
@@ -270,9 +270,11 @@ class MultiverseAPIName(Enum):
     LOAD = "load"
 
 
-class MultiverseProperty(Enum):
-    def __str__(self):
-        return self.value
+class MultiverseProperty(str, Enum):
+    __str__ = str.__str__
+    """
+    Members are their value strings, so the C-level str.__str__ returns the value without a Python-level call.
+    """
 
 
 class MultiverseBodyProperty(MultiverseProperty):
@@ -297,12 +299,21 @@ class MultiverseJointPosition(MultiverseJointProperty):
 
     @classmethod
     def from_pycram_joint_type(cls, joint_type: JointType) -> 'MultiverseJointPosition':
-        if joint_type in [JointType.REVOLUTE, JointType.CONTINUOUS]:
-            return MultiverseJointPosition.REVOLUTE_JOINT_POSITION
-        elif joint_type == JointType.PRISMATIC:
-            return MultiverseJointPosition.PRISMATIC_JOINT_POSITION
-        else:
-            raise UnsupportedJointType(joint_type)
+        try:
+            return JOINT_TYPE_TO_MULTIVERSE_POSITION[joint_type]
+        except KeyError:
+            from ..failures import UnsupportedJointType
+            raise UnsupportedJointType(joint_type) from None
+
+
+JOINT_TYPE_TO_MULTIVERSE_POSITION = {
+    JointType.REVOLUTE: MultiverseJointPosition.REVOLUTE_JOINT_POSITION,
+    JointType.CONTINUOUS: MultiverseJointPosition.REVOLUTE_JOINT_POSITION,
+    JointType.PRISMATIC: MultiverseJointPosition.PRISMATIC_JOINT_POSITION,
+}
+"""
+Lookup table from PyCRAM joint types to the corresponding MultiverseJointPosition member.
+"""
 
 
 class MultiverseJointCMD(MultiverseJointProperty):
@@ -314,15 +325,24 @@ class MultiverseJointCMD(MultiverseJointProperty):
 
     @classmethod
     def from_pycram_joint_type(cls, joint_type: JointType) -> 'MultiverseJointCMD':
-        if joint_type in [JointType.REVOLUTE, JointType.CONTINUOUS]:
-            return MultiverseJointCMD.REVOLUTE_JOINT_CMD
-        elif joint_type == JointType.PRISMATIC:
-            return MultiverseJointCMD.PRISMATIC_JOINT_CMD
-        else:
-            raise UnsupportedJointType(joint_type)
+        try:
+            return JOINT_TYPE_TO_MULTIVERSE_CMD[joint_type]
+        except KeyError:
+            from ..failures import UnsupportedJointType
+            raise UnsupportedJointType(joint_type) from None
+
+
+JOINT_TYPE_TO_MULTIVERSE_CMD = {
+    JointType.REVOLUTE: MultiverseJointCMD.REVOLUTE_JOINT_CMD,
+    JointType.CONTINUOUS: MultiverseJointCMD.REVOLUTE_JOINT_CMD,
+    JointType.PRISMATIC: MultiverseJointCMD.PRISMATIC_JOINT_CMD,
+}
+"""
+Lookup table from PyCRAM joint types to the corresponding MultiverseJointCMD member.
+"""
 
 
-class FilterConfig(Enum):
+class FilterConfig(int, Enum):
     """
     Declare existing filter methods.
     Currently supported: Butterworth
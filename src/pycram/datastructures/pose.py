@@ -228,6 +228,26 @@ class Pose(PoseStamped, HasParametrization):
         return Transform(self.position_as_list(), self.orientation_as_list(), self.frame, child_frame,
                          self.header.stamp)
 
+    def get_homogeneous_matrix(self) -> np.ndarray:
+        """
+        :return: The homogeneous matrix of this Pose
+        """
+        matrix = transformations.quaternion_matrix(self.orientation_as_list())
+        matrix[:3, 3] = self.position_as_list()
+        return matrix
+
+    @classmethod
+    def from_homogeneous_matrix(cls, matrix: np.ndarray, frame: str = "map") -> Pose:
+        """
+        Creates a Pose from a homogeneous matrix.
+
+        :param matrix: The 4x4 homogeneous matrix.
+        :param frame: The frame in which the pose is.
+        :return: A new Pose
+        """
+        return cls(transformations.translation_from_matrix(matrix).tolist(),
+                   transformations.quaternion_from_matrix(matrix).tolist(), frame)
+
     def copy(self) -> Pose:
         """
         Creates a deep copy of this pose.
@@ -410,9 +430,9 @@ class Transform(TransformStamped):
         """
         :return: The homogeneous matrix of this Transform
         """
-        translation = transformations.translation_matrix(self.translation_as_list())
-        rotation = transformations.quaternion_matrix(self.rotation_as_list())
-        return np.dot(translation, rotation)
+        matrix = transformations.quaternion_matrix(self.rotation_as_list())
+        matrix[:3, 3] = self.translation_as_list()
+        return matrix
 
     @classmethod
     def from_pose_and_child_frame(cls, pose: Pose, child_frame_name: str) -> Transform:
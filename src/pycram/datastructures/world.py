@@ -9,8 +9,7 @@ from copy import copy
 
 import numpy as np
 from geometry_msgs.msg import Point
-from trimesh.parent import Geometry3D
-from typing_extensions import List, Optional, Dict, Tuple, Callable, TYPE_CHECKING, Union, Type, deprecated
+from typing_extensions import List, Optional, Dict, Tuple, Callable, TYPE_CHECKING, Union, Type, Iterable, deprecated
 
 
 from pycrap.ontologies import PhysicalObject
@@ -39,6 +38,7 @@ from ..world_concepts.constraints import Constraint
 from ..world_concepts.event import Event
 
 if TYPE_CHECKING:
+    from trimesh.parent import Geometry3D
     from ..world_concepts.world_object import Object
     from ..description import Link, Joint, ObjectDescription
     from ..object_descriptors.generic import ObjectDescription as GenericObjectDescription
@@ -113,6 +113,11 @@ class World(WorldEntity, ABC):
         self.objects: List[Object] = []
         # List of all Objects in the World
 
+        self._objects_by_type: Dict[Type[PhysicalObject], List[Object]] = {}
+        """
+        The objects of the world grouped by their type, kept up to date by add_object and remove_object.
+        """
+
         self.is_prospection_world: bool = is_prospection
         self._init_and_sync_prospection_world()
 
@@ -183,6 +188,7 @@ class World(WorldEntity, ABC):
         """
         self.object_lock.acquire()
         self.objects.append(obj)
+        self._objects_by_type.setdefault(obj.obj_type, []).append(obj)
         self.add_object_to_original_state(obj)
         self.object_lock.release()
         self.invoke_on_add_object_callbacks(obj)
@@ -353,9 +359,7 @@ class World(WorldEntity, ABC):
         :param name: The name of the returned Objects.
         :return: The object with the given name, if there is one.
         """
-
-        matching_objects = list(filter(lambda obj: obj.name == name, self.objects))
-        return matching_objects[0] if len(matching_objects) > 0 else None
+        return next((obj for obj in self.objects if obj.name == name), None)
 
     def get_object_by_type(self, obj_type: Type[PhysicalObject]) -> List[Object]:
         """
@@ -364,7 +368,16 @@ class World(WorldEntity, ABC):
         :param obj_type: The type of the returned Objects.
         :return: A list of all Objects that have the type 'obj_type'.
         """
-        return list(filter(lambda obj: obj.obj_type == obj_type, self.objects))
+        return list(self._objects_by_type.get(obj_type, []))
+
+    def get_objects_by_types(self, obj_types: Iterable[Type[PhysicalObject]]) -> List[Object]:
+        """
+        Return a list of all Objects which have one of the given types.
+
+        :param obj_types: The types of the returned Objects.
+        :return: A list of all Objects that have one of the types, grouped by type in the order of the given types.
+        """
+        return [obj for obj_type in obj_types for obj in self._objects_by_type.get(obj_type, [])]
 
     def get_object_by_id(self, obj_id: int) -> Object:
         """
@@ -431,6 +444,7 @@ class World(WorldEntity, ABC):
 
         if self.remove_object_from_simulator(obj):
             self.objects.remove(obj)
+            self._objects_by_type[obj.obj_type].remove(obj)
             self.remove_object_from_original_state(obj)
 
         if World.robot == obj and not self.is_prospection_world:
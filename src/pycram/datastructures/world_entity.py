@@ -5,7 +5,6 @@ import pickle
 from abc import ABC, abstractmethod
 from copy import copy
 
-from trimesh.parent import Geometry3D
 from typing_extensions import TYPE_CHECKING, Dict, Optional, List, deprecated, Union, Type
 
 from pycrap.ontologies import PhysicalObject
@@ -16,6 +15,7 @@ from ..local_transformer import LocalTransformer
 from ..ros.data_types import Time
 
 if TYPE_CHECKING:
+    from trimesh.parent import Geometry3D
     from ..datastructures.world import World
     from .pose import Pose, Point, GeoQuaternion as Quaternion, Transform
 
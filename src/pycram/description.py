@@ -3,12 +3,12 @@ from __future__ import annotations
 import logging
 import os
 import pathlib
+import stat
 from abc import ABC, abstractmethod
 
-import trimesh
+import numpy as np
 from geometry_msgs.msg import Point
-from trimesh.parent import Geometry3D
-from typing_extensions import Tuple, Union, Any, List, Optional, Dict, TYPE_CHECKING, Self, Sequence
+from typing_extensions import Tuple, FrozenSet, Union, Any, List, Optional, Dict, TYPE_CHECKING, Self, Sequence, Callable
 
 from .datastructures.dataclasses import JointState, AxisAlignedBoundingBox, Color, LinkState, VisualShape, \
     MeshVisualShape, RotatedBoundingBox
@@ -16,18 +16,76 @@ from .datastructures.enums import JointType
 from .datastructures.pose import Pose, Transform
 from .datastructures.world_entity import WorldEntity, PhysicalBody
 from .failures import ObjectDescriptionNotFound, LinkHasNoGeometry, LinkGeometryHasNoMesh
-from .local_transformer import LocalTransformer
 from .ros.logging import logwarn_once
 
 if TYPE_CHECKING:
+    from trimesh.parent import Geometry3D
     from .world_concepts.world_object import Object
 
+_mesh_cache: Dict[str, Tuple[int, Geometry3D]] = {}
+"""
+Process-wide cache of loaded meshes, mapping the mesh file path to the modification time of the file and the mesh.
+"""
+
+_convex_hull_cache: Dict[str, Tuple[int, Geometry3D]] = {}
+"""
+Process-wide cache of mesh convex hulls, mapping the mesh file path to the modification time of the file and the hull.
+"""
+
+
+def _get_cached(cache: Dict[str, Tuple[int, Geometry3D]], mesh_path: str, create: Callable[[], Geometry3D]) \
+        -> Geometry3D:
+    """
+    Get an entry of the given cache, (re)creating it if the mesh file was modified since it was cached.
+
+    :param cache: The cache to look up.
+    :param mesh_path: The path of the mesh file.
+    :param create: A callable that creates the entry if it is missing or outdated.
+    :return: The cached entry.
+    """
+    modification_time = os.stat(mesh_path).st_mtime_ns
+    cached = cache.get(mesh_path)
+    if cached is None or cached[0] != modification_time:
+        cached = (modification_time, create())
+        cache[mesh_path] = cached
+    return cached[1]
+
+
+def load_mesh(mesh_path: str) -> Geometry3D:
+    """
+    Load a mesh file, reusing the already loaded mesh if the file did not change since it was loaded.
+    The returned mesh is shared, so it should not be modified in place.
+
+    :param mesh_path: The path of the mesh file.
+    :return: The loaded mesh.
+    """
+    import trimesh
+    return _get_cached(_mesh_cache, mesh_path, lambda: trimesh.load(mesh_path))
+
+
+def get_mesh_convex_hull(mesh_path: str) -> Geometry3D:
+    """
+    Get the convex hull of a mesh file, reusing the already computed hull if the file did not change.
+    The returned hull is shared, so it should be copied before modifying it.
+
+    :param mesh_path: The path of the mesh file.
+    :return: The convex hull of the mesh.
+    """
+    import trimesh
+    return _get_cached(_convex_hull_cache, mesh_path, lambda: trimesh.convex.convex_hull(load_mesh(mesh_path)))
+
 
 class EntityDescription(ABC):
     """
     A description of an entity. This can be a link, joint or object description.
     """
 
+    __slots__ = ('parsed_description',)
+    """
+    Link and joint descriptions are created for every link and joint of every object, so they do not carry a __dict__.
+    Subclasses have to declare __slots__ as well, otherwise their instances get a __dict__ again.
+    """
+
     def __init__(self, parsed_description: Optional[Any] = None):
         """
         :param parsed_description: The parsed description (most likely from a description file) of the entity.
@@ -56,6 +114,8 @@ class LinkDescription(EntityDescription):
     A link description of an object.
     """
 
+    __slots__ = ('mesh_dir',)
+
     def __init__(self, parsed_link_description: Any, mesh_dir: Optional[str] = None):
         self.parsed_description = parsed_link_description
         self.mesh_dir = mesh_dir
@@ -74,6 +134,8 @@ class JointDescription(EntityDescription):
     A class that represents the description of a joint.
     """
 
+    __slots__ = ('is_virtual',)
+
     def __init__(self, parsed_joint_description: Optional[Any] = None, is_virtual: bool = False):
         """
         :param parsed_joint_description: The parsed description of the joint (e.g. from urdf or mjcf file).
@@ -171,6 +233,7 @@ class ObjectEntity:
 
     def __init__(self, obj: Object):
         self.object: Object = obj
+        self._object_id: int = obj.id
 
     @property
     def object_name(self) -> str:
@@ -184,7 +247,7 @@ class ObjectEntity:
         """
         :return: the id of the object to which this entity belongs.
         """
-        return self.object.id
+        return self._object_id
 
 
 class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
@@ -192,13 +255,19 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
     A link of an Object in the World.
     """
 
+    _pose_setter_warning_logged: bool = False
+    """
+    Whether the warning that the pose of a link cannot be set was already logged.
+    """
+
     def __init__(self, _id: int, link_description: LinkDescription, obj: Object):
         PhysicalBody.__init__(self, _id, obj.world)
         ObjectEntity.__init__(self, obj)
         LinkDescription.__init__(self, link_description.parsed_description, link_description.mesh_dir)
         self.description = link_description
-        self.local_transformer: LocalTransformer = LocalTransformer()
+        self._name: str = link_description.name
         self.constraint_ids: Dict[Link, int] = {}
+        self._tf_frame: Optional[str] = None
 
     @property
     def parent_entity(self) -> Object:
@@ -212,7 +281,7 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
         """
         :return: The name of this link.
         """
-        return self.description.name
+        return self._name
 
     def get_axis_aligned_bounding_box(self, transform_to_link_pose: bool = True) -> AxisAlignedBoundingBox:
         """
@@ -241,17 +310,25 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
                                                                      self.transform)
 
     def get_axis_aligned_bounding_box_from_geometry(self) -> AxisAlignedBoundingBox:
-        if isinstance(self.geometry, List):
-            all_boxes = [geom.get_axis_aligned_bounding_box(self.get_mesh_path(geom))
-                         if isinstance(geom, MeshVisualShape) else geom.get_axis_aligned_bounding_box()
-                         for geom in self.geometry
-                         ]
-            bounding_box = AxisAlignedBoundingBox.from_multiple_bounding_boxes(all_boxes)
-        else:
-            geom = self.geometry
-            bounding_box = geom.get_axis_aligned_bounding_box(self.get_mesh_path(geom)) \
-                if isinstance(geom, MeshVisualShape) else geom.get_axis_aligned_bounding_box()
-        return bounding_box
+        geometry = self.geometry
+        if not isinstance(geometry, List):
+            return AxisAlignedBoundingBox.from_min_max(*self._get_geometry_extrema(geometry))
+        # Collect the extrema of all geometries in one array and reduce them at once.
+        extrema = np.empty((len(geometry), 2, 3), dtype=np.float64)
+        for i, geom in enumerate(geometry):
+            extrema[i] = self._get_geometry_extrema(geom)
+        return AxisAlignedBoundingBox.from_min_max(extrema[:, 0].min(axis=0).tolist(),
+                                                   extrema[:, 1].max(axis=0).tolist())
+
+    def _get_geometry_extrema(self, geom: VisualShape) -> Tuple[Sequence[float], Sequence[float]]:
+        """
+        :param geom: One of the geometries of this link.
+        :return: The minimum and maximum point of the axis-aligned bounding box of the geometry, mesh files are loaded
+         through the mesh cache.
+        """
+        if isinstance(geom, MeshVisualShape):
+            return load_mesh(self.get_mesh_path(geom)).bounds
+        return geom.get_axis_aligned_bounding_box().get_min_max()
 
     def get_convex_hull(self) -> Geometry3D:
         """
@@ -260,12 +337,12 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
         try:
             return self.world.get_body_convex_hull(self)
         except NotImplementedError:
-            if isinstance(self.geometry, MeshVisualShape):
-                mesh_path = self.get_mesh_path(self.geometry)
-                mesh = trimesh.load(mesh_path)
-                return trimesh.convex.convex_hull(mesh).apply_transform(self.transform.get_homogeneous_matrix())
+            geometry = self.geometry
+            if isinstance(geometry, MeshVisualShape):
+                hull = geometry.get_convex_hull(self.get_mesh_path(geometry)).copy()
+                return hull.apply_transform(self.transform.get_homogeneous_matrix())
             else:
-                raise LinkGeometryHasNoMesh(self.name, type(self.geometry).__name__)
+                raise LinkGeometryHasNoMesh(self.name, type(geometry).__name__)
 
     def _plot_convex_hull(self):
         """
@@ -311,7 +388,8 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
 
         :param pose: The link pose.
         """
-        return (pose.to_transform(self.tf_frame) * self.get_transform_to_root_link()).to_pose()
+        object_matrix = pose.get_homogeneous_matrix() @ self.get_transform_to_root_link().get_homogeneous_matrix()
+        return Pose.from_homogeneous_matrix(object_matrix, pose.frame)
 
     def get_pose_given_object_pose(self, pose):
         """
@@ -320,7 +398,8 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
 
         :param pose: The object pose.
         """
-        return (pose.to_transform(self.object.tf_frame) * self.get_transform_from_root_link()).to_pose()
+        link_matrix = pose.get_homogeneous_matrix() @ self.get_transform_from_root_link().get_homogeneous_matrix()
+        return Pose.from_homogeneous_matrix(link_matrix, pose.frame)
 
     def get_transform_from_root_link(self) -> Transform:
         """
@@ -340,7 +419,8 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
 
     @current_state.setter
     def current_state(self, link_state: LinkState) -> None:
-        if self.current_state != link_state:
+        # Compare the fields directly instead of building a LinkState, which would copy the constraint ids.
+        if self.body_state != link_state.body_state or self.constraint_ids != link_state.constraint_ids:
             if not self.all_constraint_links_belong_to_same_world(link_state):
                 raise ValueError("All constraint links must belong to the same world, since the constraint ids"
                                  "are unique to the world and cannot be transferred between worlds.")
@@ -354,8 +434,9 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
         :param other: The state of the other link.
         :return: True if all links belong to the same world, False otherwise.
         """
-        return all([link.world == other_link.world for link, other_link in zip(self.constraint_ids.keys(),
-                                                                               other.constraint_ids.keys())])
+        world_ids = {id(link.world) for link in self.constraint_ids}
+        world_ids.update(id(link.world) for link in other.constraint_ids)
+        return len(world_ids) <= 1
 
     def add_fixed_constraint_with_link(self, child_link: Self,
                                        child_to_parent_transform: Optional[Transform] = None) -> int:
@@ -417,7 +498,17 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
         :param link: The link with respect to which the pose should be returned.
         :return: A Pose object with the pose of this link with respect to the given link.
         """
-        return self.local_transformer.transform_pose(self.pose, link.tf_frame)
+        pose = self.pose
+        link_pose = link.pose
+        if link.world is not self.world or pose.frame != link_pose.frame:
+            return self.local_transformer.transform_pose(pose, link.tf_frame)
+        link_matrix = link_pose.get_homogeneous_matrix()
+        # The inverse of a rigid transform [R, t] is [R^T, -R^T t], so no general matrix inversion is needed.
+        link_rotation_transposed = link_matrix[:3, :3].T
+        relative_matrix = pose.get_homogeneous_matrix()
+        relative_matrix[:3, 3] = link_rotation_transposed @ (relative_matrix[:3, 3] - link_matrix[:3, 3])
+        relative_matrix[:3, :3] = link_rotation_transposed @ relative_matrix[:3, :3]
+        return Pose.from_homogeneous_matrix(relative_matrix, link.tf_frame)
 
     def get_origin_transform(self) -> Transform:
         """
@@ -434,6 +525,10 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
 
     @pose.setter
     def pose(self, pose: Pose) -> None:
+        # logwarn_once inspects the call stack on every call, so skip it entirely once the warning was logged.
+        if Link._pose_setter_warning_logged:
+            return
+        Link._pose_setter_warning_logged = True
         logwarn_once("Setting the pose of a link is not allowed,"
                      " change object pose and/or joint position to affect the link pose.")
 
@@ -456,10 +551,24 @@ class Link(PhysicalBody, ObjectEntity, LinkDescription, ABC):
     @property
     def tf_frame(self) -> str:
         """
-        The name of the tf frame of this link.
+        The name of the tf frame of this link, computed once and cached until the object is renamed.
+        """
+        if self._tf_frame is None:
+            self._tf_frame = self._compute_tf_frame()
+        return self._tf_frame
+
+    def _compute_tf_frame(self) -> str:
+        """
+        :return: The name of the tf frame of this link.
         """
         return f"{self.object.tf_frame}/{self.name}"
 
+    def reset_tf_frame_cache(self) -> None:
+        """
+        Reset the cached tf frame name, needs to be called when the name of the object changes.
+        """
+        self._tf_frame = None
+
     @property
     def origin_transform(self) -> Transform:
         """
@@ -477,11 +586,17 @@ class RootLink(Link, ABC):
     This differs from the normal AbstractLink class in that the pose and the tf_frame is the same as that of the object.
     """
 
-    def __init__(self, obj: Object):
-        Link.__init__(self, obj.get_root_link_id(), obj.get_root_link_description(), obj)
+    def __init__(self, obj: Object, link_description: Optional[LinkDescription] = None):
+        """
+        :param obj: The object to which this root link belongs.
+        :param link_description: The description of the root link, if it is already known, otherwise it is looked up
+         in the description of the object.
+        """
+        if link_description is None:
+            link_description = obj.get_root_link_description()
+        Link.__init__(self, obj.get_root_link_id(), link_description, obj)
 
-    @property
-    def tf_frame(self) -> str:
+    def _compute_tf_frame(self) -> str:
         """
         :return: the tf frame of the root link, which is the same as the tf frame of the object.
         """
@@ -510,8 +625,15 @@ class Joint(WorldEntity, ObjectEntity, JointDescription, ABC):
         ObjectEntity.__init__(self, obj)
         JointDescription.__init__(self, joint_description.parsed_description, is_virtual)
         self.description = joint_description
+        self._name: str = joint_description.name
+        self._type: JointType = joint_description.type
+        self._parent_name: str = joint_description.parent
+        self._child_name: str = joint_description.child
         self.acceptable_error = (self.world.conf.revolute_joint_position_tolerance if self.type == JointType.REVOLUTE
                                  else self.world.conf.prismatic_joint_position_tolerance)
+        self._parent_link: Link = self.object.get_link(self.parent)
+        self._child_link: Link = self.object.get_link(self.child)
+        self._limits: Optional[Tuple[float, float]] = None
         self._update_position()
 
     @property
@@ -519,7 +641,28 @@ class Joint(WorldEntity, ObjectEntity, JointDescription, ABC):
         """
         :return: The name of this joint.
         """
-        return self.description.name
+        return self._name
+
+    @property
+    def type(self) -> JointType:
+        """
+        :return: The type of this joint.
+        """
+        return self._type
+
+    @property
+    def parent(self) -> str:
+        """
+        :return: The name of the parent link of this joint.
+        """
+        return self._parent_name
+
+    @property
+    def child(self) -> str:
+        """
+        :return: The name of the child link of this joint.
+        """
+        return self._child_name
 
     @property
     def parent_entity(self) -> Link:
@@ -553,14 +696,23 @@ class Joint(WorldEntity, ObjectEntity, JointDescription, ABC):
         """
         :return: The parent link as a AbstractLink object.
         """
-        return self.object.get_link(self.parent)
+        return self._parent_link
 
     @property
     def child_link(self) -> Link:
         """
         :return: The child link as a AbstractLink object.
         """
-        return self.object.get_link(self.child)
+        return self._child_link
+
+    @property
+    def limits(self) -> Tuple[float, float]:
+        """
+        :return: The lower and upper limits of this joint, computed on first access since they do not change.
+        """
+        if self._limits is None:
+            self._limits = super().limits
+        return self._limits
 
     @property
     def position(self) -> float:
@@ -576,7 +728,7 @@ class Joint(WorldEntity, ObjectEntity, JointDescription, ABC):
         """
         :return: The integer id of the object to which this joint belongs.
         """
-        return self.object.id
+        return self._object_id
 
     @position.setter
     def position(self, joint_position: float) -> None:
@@ -633,9 +785,9 @@ class ObjectDescription(EntityDescription):
     A class that represents the description of an object.
     """
 
-    mesh_extensions: Tuple[str] = (".obj", ".stl", ".dae", ".ply")
+    mesh_extensions: FrozenSet[str] = frozenset({".obj", ".stl", ".dae", ".ply"})
     """
-    The file extensions of the mesh files that can be used to generate a description file.
+    The lower case file extensions of the mesh files that can be used to generate a description file.
     """
 
     class Link(Link, ABC):
@@ -656,6 +808,7 @@ class ObjectDescription(EntityDescription):
         self._joints: Optional[List[JointDescription]] = None
         self._link_map: Optional[Dict[str, Any]] = None
         self._joint_map: Optional[Dict[str, Any]] = None
+        self._chains: Dict[Tuple[str, str, bool, bool, bool], List[str]] = {}
         self.original_path: Optional[str] = path
 
         if path:
@@ -731,7 +884,7 @@ class ObjectDescription(EntityDescription):
 
         :param path: The path of the file to update from.
         """
-        self._parsed_description = self.load_description(path)
+        self.parsed_description = self.load_description(path)
 
     def update_description_from_string(self, description_string: str) -> None:
         """
@@ -739,7 +892,7 @@ class ObjectDescription(EntityDescription):
 
         :param description_string: The description string to update from.
         """
-        self._parsed_description = self.load_description_from_string(description_string)
+        self.parsed_description = self.load_description_from_string(description_string)
 
     def load_description_from_string(self, description_string: str) -> Any:
         """
@@ -762,6 +915,18 @@ class ObjectDescription(EntityDescription):
         :param parsed_description: The parsed description object (depends on the description file type).
         """
         self._parsed_description = parsed_description
+        self.reset_cached_links_and_joints()
+
+    def reset_cached_links_and_joints(self) -> None:
+        """
+        Reset the link and joint descriptions and maps that are built from the parsed description, such that they are
+        built again on their next access. This has to be called whenever the parsed description changes.
+        """
+        self._links = None
+        self._joints = None
+        self._link_map = None
+        self._joint_map = None
+        self._chains = {}
 
     @abstractmethod
     def load_description(self, path: str) -> Any:
@@ -791,8 +956,9 @@ class ObjectDescription(EntityDescription):
         :raises ObjectDescriptionNotFound: If the description file could not be found/read.
         """
 
-        if extension in self.mesh_extensions:
-            if extension == ".ply":
+        if extension.lower() in self.mesh_extensions:
+            if extension.lower() == ".ply":
+                import trimesh
                 mesh = trimesh.load(path)
                 if scale_mesh is not None:
                     mesh.apply_scale(scale_mesh)
@@ -817,16 +983,17 @@ class ObjectDescription(EntityDescription):
     @staticmethod
     def check_description_file_exists_and_can_be_read(path: str) -> bool:
         """
-        Check if the description file exists at the given path.
+        Check if the description file exists at the given path, is readable and is not empty. Only the file metadata
+        is queried, the file content is not read.
 
         :param path: The path to the description file.
         :return: True if the file exists, False otherwise.
         """
-        exists = os.path.exists(path)
-        if exists:
-            with open(path, "r") as file:
-                exists = bool(file.read())
-        return exists
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0 and os.access(path, os.R_OK)
 
     @staticmethod
     def write_description_to_file(description_string: str, save_path: str) -> None:
@@ -846,12 +1013,13 @@ class ObjectDescription(EntityDescription):
         :param object_name: The name of the object.
         :return: The file name of the description file.
         """
-        if extension in self.mesh_extensions:
-            file_name = path_object.stem + self.get_file_extension()
-        elif extension == self.get_file_extension():
+        file_extension = self.get_file_extension()
+        if extension.lower() in self.mesh_extensions:
+            file_name = path_object.stem + file_extension
+        elif extension == file_extension:
             file_name = path_object.name
         else:
-            file_name = object_name + self.get_file_extension()
+            file_name = object_name + file_extension
 
         return file_name
 
@@ -935,10 +1103,29 @@ class ObjectDescription(EntityDescription):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def get_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
                   links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
         """
+        Get the chain between two links, each chain is only computed once per parsed description.
+
+        :param start_link_name: The name of the start link of the chain.
+        :param end_link_name: The name of the end link of the chain.
+        :param joints: Whether to include joints in the chain.
+        :param links: Whether to include links in the chain.
+        :param fixed: Whether to include fixed joints in the chain.
+        :return: the chain of links from 'start_link_name' to 'end_link_name'.
+        """
+        key = (start_link_name, end_link_name, joints, links, fixed)
+        if key not in self._chains:
+            self._chains[key] = self.compute_chain(*key)
+        return list(self._chains[key])
+
+    @abstractmethod
+    def compute_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
+                      links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
+        """
+        Compute the chain between two links from the parsed description, see :meth:`get_chain` for the parameters.
+
         :return: the chain of links from 'start_link_name' to 'end_link_name'.
         """
         pass
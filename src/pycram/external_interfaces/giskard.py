@@ -314,6 +314,22 @@ def achieve_joint_goal(goal_poses: Dict[str, float]) -> 'MoveResult':
     return giskard_wrapper.execute()
 
 
+@init_giskard_interface
+@thread_safe
+def achieve_joint_goal_collision_free(goal_poses: Dict[str, float]) -> 'MoveResult':
+    """
+    Takes a dictionary of joint position that should be achieved while avoiding all collisions. The collision avoidance
+    and the joint goal are added to the same motion goal under one lock, such that no other goal can be interleaved,
+    and are sent to giskard in a single execute.
+
+    :param goal_poses: Dictionary with joint names and position goals
+    :return: MoveResult message for this goal
+    """
+    giskard_wrapper.avoid_all_collisions()
+    set_joint_goal(goal_poses)
+    return giskard_wrapper.execute()
+
+
 @init_giskard_interface
 @thread_safe
 def set_joint_goal(goal_poses: Dict[str, float]) -> None:
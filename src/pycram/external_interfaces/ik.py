@@ -146,7 +146,8 @@ def try_to_reach(pose_or_object: Union[Pose, Object], prospection_robot: Object,
     """
     input_pose = pose_or_object.get_pose() if isinstance(pose_or_object, Object) else pose_or_object
 
-    arm_chain = list(filter(lambda chain: chain.get_tool_frame() == gripper_name, RobotDescription.current_robot_description.get_manipulator_chains()))[0]
+    arm_chain = next(chain for chain in RobotDescription.current_robot_description.get_manipulator_chains()
+                     if chain.get_tool_frame() == gripper_name)
 
     joints = arm_chain.joints
 
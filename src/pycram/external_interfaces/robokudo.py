@@ -1,9 +1,10 @@
-import sys
-from threading import Lock, RLock
+import time
+from concurrent.futures import Future
+from threading import Lock
 from typing import Any
 
 from ..ros.action_lib import create_action_client
-from ..ros.logging import logwarn, loginfo, loginfo_once
+from ..ros.logging import logwarn, loginfo, loginfo_once, logdebug
 from ..ros.ros_tools import get_node_names
 
 from geometry_msgs.msg import PointStamped
@@ -23,12 +24,15 @@ except ModuleNotFoundError as e:
 is_init = False
 client = None
 
-number_of_par_goals = 0
+ROBOKUDO_NODE_CHECK_INTERVAL = 2.0
+"""
+Seconds for which the result of checking whether the Robokudo node is running is reused, since the check asks the ROS
+master for all node names.
+"""
+_robokudo_node_check_time: Optional[float] = None
+_robokudo_node_running = False
+
 robokudo_lock = Lock()
-robokudo_rlock = RLock()
-with robokudo_rlock:
-    par_threads = {}
-    par_motion_goal = {}
 
 
 def thread_safe(func: Callable) -> Callable:
@@ -40,16 +44,32 @@ def thread_safe(func: Callable) -> Callable:
     """
 
     def wrapper(*args, **kwargs):
-        with robokudo_rlock:
+        with robokudo_lock:
             return func(*args, **kwargs)
 
     return wrapper
 
 
+def is_robokudo_running() -> bool:
+    """
+    Check if the Robokudo node is running, the result is reused for ROBOKUDO_NODE_CHECK_INTERVAL seconds.
+
+    :return: True if the Robokudo node is running, False otherwise.
+    """
+    global _robokudo_node_check_time
+    global _robokudo_node_running
+    now = time.monotonic()
+    if _robokudo_node_check_time is None or now - _robokudo_node_check_time >= ROBOKUDO_NODE_CHECK_INTERVAL:
+        _robokudo_node_running = "/robokudo" in get_node_names()
+        _robokudo_node_check_time = now
+    return _robokudo_node_running
+
+
 def init_robokudo_interface(func: Callable) -> Callable:
     """
     Checks if the ROS messages are available and if Robokudo is running, if that is the case the interface will be
-    initialized.
+    initialized. Functions decorated with this call the undecorated implementations of each other, so each call
+    checks the interface only once.
 
     :param func: Function this decorator should be wrapping
     :return: A callable function which initializes the interface and then calls the wrapped function
@@ -58,18 +78,18 @@ def init_robokudo_interface(func: Callable) -> Callable:
     def wrapper(*args, **kwargs):
         global is_init
         global client
-        if is_init and "/robokudo" in get_node_names():
-            return func(*args, **kwargs)
-        elif is_init and "/robokudo" not in get_node_names():
+        if is_init:
+            if is_robokudo_running():
+                return func(*args, **kwargs)
             logwarn("Robokudo node is not available anymore, could not initialize robokudo interface")
             is_init = False
             return
 
-        if "robokudo_msgs" not in sys.modules:
+        if not robokudo_found:
             logwarn("Could not initialize the Robokudo interface since the robokudo_msgs are not imported")
             return
 
-        if "/robokudo" in get_node_names():
+        if is_robokudo_running():
             loginfo_once("Successfully initialized Robokudo interface")
             is_init = True
             client = create_action_client("robokudo/query", QueryAction)
@@ -88,12 +108,13 @@ def init_robokudo_interface(func: Callable) -> Callable:
     return wrapper
 
 
-@init_robokudo_interface
-def send_query(obj_type: Optional[str] = None, region: Optional[str] = None,
-               attributes: Optional[List[str]] = None) -> Any:
-    """Generic function to send a query to RoboKudo."""
+def _create_query_goal(obj_type: Optional[str] = None, region: Optional[str] = None,
+                       attributes: Optional[List[str]] = None) -> 'QueryGoal':
+    """
+    Create the goal of a RoboKudo query.
 
-    global client
+    :return: The goal with the given object type, region and attributes set.
+    """
     goal = QueryGoal()
 
     if obj_type:
@@ -102,32 +123,78 @@ def send_query(obj_type: Optional[str] = None, region: Optional[str] = None,
         goal.obj.location = region
     if attributes:
         goal.obj.attribute = attributes
+    return goal
 
-    query_result = None
+
+@init_robokudo_interface
+def send_query_async(obj_type: Optional[str] = None, region: Optional[str] = None,
+                     attributes: Optional[List[str]] = None) -> Future:
+    """
+    Send a query to RoboKudo without waiting for the result. The action client tracks one goal at a time, so sending
+    another query before this one is done stops the tracking of this one and its future is never resolved.
+
+    :return: A future that is resolved with the query result once the action server is done with the query.
+    """
+    return _send_query_async(obj_type, region, attributes)
+
+
+def _send_query_async(obj_type: Optional[str] = None, region: Optional[str] = None,
+                      attributes: Optional[List[str]] = None) -> Future:
+    """
+    Implementation of send_query_async without the interface check, for use in already checked functions.
+    """
+    global client
+    goal = _create_query_goal(obj_type, region, attributes)
+    query_result = Future()
 
     def done_callback(state, result):
-        nonlocal query_result
-        query_result = result
-        loginfo("Query completed with state: %s" % state)
+        query_result.set_result(result)
+        loginfo("Query completed with state: %s", state)
 
     def active_callback():
-        loginfo("Goal is now being processed by the action server")
+        logdebug("Goal is now being processed by the action server")
 
     def feedback_callback(feedback):
-        loginfo("Received feedback: %s" % feedback)
+        logdebug("Received feedback: %s", feedback)
 
     client.send_goal(goal, done_cb=done_callback, active_cb=active_callback, feedback_cb=feedback_callback)
     loginfo("Goal has been sent to the action server")
+    return query_result
 
-    client.wait_for_result()
+
+@init_robokudo_interface
+def send_query(obj_type: Optional[str] = None, region: Optional[str] = None,
+               attributes: Optional[List[str]] = None, with_feedback: bool = False) -> Any:
+    """
+    Generic function to send a query to RoboKudo and wait for its result.
+
+    :param with_feedback: If True, the query is sent with callbacks that log its progress and feedback, otherwise the
+     goal is sent without callbacks and only its result is fetched.
+    """
+    return _send_query(obj_type, region, attributes, with_feedback)
+
+
+def _send_query(obj_type: Optional[str] = None, region: Optional[str] = None,
+                attributes: Optional[List[str]] = None, with_feedback: bool = False) -> Any:
+    """
+    Implementation of send_query without the interface check, for use in already checked functions.
+    """
+    if not with_feedback:
+        client.send_goal(_create_query_goal(obj_type, region, attributes))
+        loginfo("Waiting for result from the action server")
+        client.wait_for_result()
+        return client.get_result()
+    query_result = _send_query_async(obj_type, region, attributes)
     loginfo("Waiting for result from the action server")
-    return query_result
+    client.wait_for_result()
+    # The done callback runs before wait_for_result returns, it was not called if the goal is no longer tracked.
+    return query_result.result() if query_result.done() else None
 
 
 @init_robokudo_interface
 def query_all_objects() -> dict:
     """Query RoboKudo for all objects."""
-    result = send_query()
+    result = _send_query()
 
     return result
 
@@ -135,18 +202,13 @@ def query_all_objects() -> dict:
 @init_robokudo_interface
 def query_object(obj_desc: ObjectDesignatorDescription) -> dict:
     """Query RoboKudo for an object that fits the description."""
-    goal = QueryGoal()
-    goal.obj.type = str(obj_desc.types[0])
-
-    result = send_query(obj_type=goal.obj.type)
-
-    return result
+    return _send_query(obj_type=str(obj_desc.types[0]))
 
 
 @init_robokudo_interface
 def query_human() -> PointStamped:
     """Query RoboKudo for human detection and return the detected human's pose."""
-    result = send_query(obj_type='human')
+    result = _send_query(obj_type='human')
     if result:
         return result  # Assuming result is of type PointStamped or similar.
     return None
@@ -163,19 +225,19 @@ def stop_query():
 @init_robokudo_interface
 def query_specific_region(region: str) -> Any:
     """Query RoboKudo to scan a specific region."""
-    return send_query(region=region)
+    return _send_query(region=region)
 
 
 @init_robokudo_interface
 def query_human_attributes() -> Any:
     """Query RoboKudo for human attributes like brightness of clothes, headgear, and gender."""
-    return send_query(obj_type='human', attributes=["attributes"])
+    return _send_query(obj_type='human', attributes=["attributes"])
 
 
 @init_robokudo_interface
 def query_waving_human() -> Pose:
     """Query RoboKudo for detecting a waving human."""
-    result = send_query(obj_type='human')
+    result = _send_query(obj_type='human')
     if result and result.res:
         try:
             pose = Pose.from_pose_stamped(result.res[0].pose[0])
@@ -183,3 +245,14 @@ def query_waving_human() -> Pose:
         except IndexError:
             pass
     return None
+
+
+@init_robokudo_interface
+def query_regions(regions: List[str]) -> List[Any]:
+    """
+    Query RoboKudo to scan each of the given regions one after another.
+
+    :param regions: The regions to scan.
+    :return: The query results in the order of the regions.
+    """
+    return [_send_query(region=region) for region in regions]
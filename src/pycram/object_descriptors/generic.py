@@ -22,6 +22,7 @@ class NamedBoxVisualShape(BoxVisualShape):
 
 
 class LinkDescription(AbstractLinkDescription):
+    __slots__ = ()
 
     def __init__(self, name: str, visual_frame_position: List[float], half_extents: List[float],
                  color: Color = Color()):
@@ -45,6 +46,7 @@ class LinkDescription(AbstractLinkDescription):
 
 
 class JointDescription(AbstractJointDescription):
+    __slots__ = ()
 
     @property
     def parent(self) -> str:
@@ -172,8 +174,8 @@ class ObjectDescription(AbstractObjectDescription):
     def get_root(self) -> str:
         return self._links[0].name
 
-    def get_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
-                  links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
+    def compute_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
+                      links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
         raise NotImplementedError("Do Not Do This on generic objects as they have no chains")
 
     @staticmethod
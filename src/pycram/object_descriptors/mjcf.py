@@ -1,6 +1,7 @@
 import glob
 import os
 import pathlib
+import sys
 from xml.etree import ElementTree as ET
 
 import numpy as np
@@ -29,12 +30,20 @@ except ImportError:
     # do not import this module if multiverse is not found
     raise ImportError("Multiverse not found.")
 
+_mesh_file_paths: Dict[Tuple[str, str], str] = {}
+"""
+Process-wide cache of mesh files found in mesh directories, mapping the mesh directory and the file name to the
+interned path of the file.
+"""
+
 
 class LinkDescription(AbstractLinkDescription):
     """
     A class that represents a link description of an object.
     """
 
+    __slots__ = ()
+
     def __init__(self, mjcf_description: mjcf.Element, mesh_dir: Optional[str] = None):
         super().__init__(mjcf_description)
         self.mesh_dir = mesh_dir
@@ -57,13 +66,13 @@ class LinkDescription(AbstractLinkDescription):
         :param mjcf_geometry: The MJCFGeometry to get the visual shape for.
         :return: The VisualShape of the given MJCFGeometry object.
         """
-        if mjcf_geometry.type == MJCFGeomType.BOX.value:
+        if mjcf_geometry.type == MJCFGeomType.BOX:
             return BoxVisualShape(Color(), [0, 0, 0], mjcf_geometry.size)
-        if mjcf_geometry.type == MJCFGeomType.CYLINDER.value:
+        if mjcf_geometry.type == MJCFGeomType.CYLINDER:
             return CylinderVisualShape(Color(), [0, 0, 0], mjcf_geometry.size[0], mjcf_geometry.size[1] * 2)
-        if mjcf_geometry.type == MJCFGeomType.SPHERE.value:
+        if mjcf_geometry.type == MJCFGeomType.SPHERE:
             return SphereVisualShape(Color(), [0, 0, 0], mjcf_geometry.size[0])
-        if mjcf_geometry.type == MJCFGeomType.MESH.value:
+        if mjcf_geometry.type == MJCFGeomType.MESH:
             mesh_filename = mjcf_geometry.mesh.file.prefix + mjcf_geometry.mesh.file.extension
             mesh_filename = self.look_for_file_in_mesh_dir(mesh_filename)
             return MeshVisualShape(Color(), [0, 0, 0], mjcf_geometry.mesh.scale, mesh_filename)
@@ -71,20 +80,28 @@ class LinkDescription(AbstractLinkDescription):
 
     def look_for_file_in_mesh_dir(self, file_name: str) -> str:
         """
-        Look for a file in the mesh directory of the object.
+        Look for a file in the mesh directory of the object. Found files are cached, such that the mesh directory is
+        only searched once per file.
 
         :param file_name: The name of the file.
         :return: The path to the file.
         """
+        if self.mesh_dir is None:
+            return None
+        key = (self.mesh_dir, file_name)
+        if key in _mesh_file_paths:
+            return _mesh_file_paths[key]
         # search for the file in the mesh directory
-        if self.mesh_dir is not None:
-            if os.path.exists(os.path.join(self.mesh_dir, file_name)):
-                return os.path.join(self.mesh_dir, file_name)
-            else:
-                # use glob to search for the file in the mesh directory
-                files = glob.glob(os.path.join(self.mesh_dir, '**', file_name), recursive=True)
-                if len(files) > 0:
-                    return files[0]
+        if os.path.exists(os.path.join(self.mesh_dir, file_name)):
+            file_path = os.path.join(self.mesh_dir, file_name)
+        else:
+            # use glob to search for the file in the mesh directory
+            files = glob.glob(os.path.join(self.mesh_dir, '**', file_name), recursive=True)
+            if len(files) == 0:
+                return None
+            file_path = files[0]
+        _mesh_file_paths[key] = sys.intern(file_path)
+        return _mesh_file_paths[key]
 
     @property
     def origin(self) -> Union[Pose, None]:
@@ -99,6 +116,8 @@ class LinkDescription(AbstractLinkDescription):
 
 
 class JointDescription(AbstractJointDescription):
+    __slots__ = ()
+
     mjcf_type_map = {
         MJCFJointType.HINGE.value: JointType.REVOLUTE,
         MJCFJointType.BALL.value: JointType.SPHERICAL,
@@ -357,6 +376,11 @@ class ObjectDescription(AbstractObjectDescription):
         self.virtual_joint_names = []
         self._meshes_dir: Optional[str] = None
 
+    def reset_cached_links_and_joints(self) -> None:
+        super().reset_cached_links_and_joints()
+        self._child_map = None
+        self._parent_map = None
+
     @property
     def mesh_dir(self) -> Optional[str]:
         try:
@@ -447,6 +471,7 @@ class ObjectDescription(AbstractObjectDescription):
             axis = [axis.x, axis.y, axis.z]
         self.parsed_description.find(child).add('joint', name=name, type=JointDescription.pycram_type_map[joint_type],
                                                 axis=axis, pos=position, quat=quaternion, range=limit)
+        self.reset_cached_links_and_joints()
         if is_virtual:
             self.virtual_joint_names.append(name)
 
@@ -475,14 +500,25 @@ class ObjectDescription(AbstractObjectDescription):
         factory.export_to_mjcf(output_file_path=save_path)
 
     def generate_from_description_file(self, path: str, save_path: str, make_mesh_paths_absolute: bool = True) -> None:
-        model_str = self.replace_relative_paths_with_absolute_paths(path)
-        self.write_description_to_file(model_str, save_path)
+        # The tree is written to the file directly, so the serialized model is never held in memory as a whole.
+        tree = self.parse_with_absolute_paths(path)
+        tree.write(save_path, encoding='unicode', method='xml')
 
     def replace_relative_paths_with_absolute_paths(self, model_path: str) -> str:
         """
         Replace the relative paths in the xml file to be absolute paths.
 
         :param model_path: The path to the xml file.
+        :return: The xml string with the absolute paths.
+        """
+        return ET.tostring(self.parse_with_absolute_paths(model_path).getroot(), encoding='unicode', method='xml')
+
+    def parse_with_absolute_paths(self, model_path: str) -> ET.ElementTree:
+        """
+        Parse the xml file and replace the relative mesh and texture directories in it with absolute paths.
+
+        :param model_path: The path to the xml file.
+        :return: The parsed xml tree with the absolute paths.
         """
         tree = ET.parse(model_path)
         root = tree.getroot()
@@ -494,7 +530,7 @@ class ObjectDescription(AbstractObjectDescription):
             if rel_dir_attrib == self.MESH_DIR_ATTR:
                 self._meshes_dir = abs_dir
             compiler.set(rel_dir_attrib, abs_dir)
-        return ET.tostring(root, encoding='unicode', method='xml')
+        return tree
 
     def generate_from_parameter_server(self, name: str, save_path: str) -> None:
         mjcf_string = get_parameter(name)
@@ -545,8 +581,8 @@ class ObjectDescription(AbstractObjectDescription):
                 link = child
         return link
 
-    def get_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
-                  links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
+    def compute_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
+                      links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
         """
         :param start_link_name: The name of the start link of the chain.
         :param end_link_name: The name of the end link of the chain.
@@ -29,6 +29,8 @@ class LinkDescription(AbstractLinkDescription):
     A class that represents a link description of an object.
     """
 
+    __slots__ = ()
+
     def __init__(self, urdf_description: urdf.Link):
         super().__init__(urdf_description)
         # match the name of the link to the class in the ontology that this may be
@@ -91,6 +93,8 @@ class LinkDescription(AbstractLinkDescription):
 
 
 class JointDescription(AbstractJointDescription):
+    __slots__ = ()
+
     urdf_type_map = {'unknown': JointType.UNKNOWN,
                      'revolute': JointType.REVOLUTE,
                      'continuous': JointType.CONTINUOUS,
@@ -253,6 +257,7 @@ class ObjectDescription(AbstractObjectDescription):
                            JointDescription.pycram_type_map[joint_type],
                            axis, origin, limit)
         self.parsed_description.add_joint(joint)
+        self.reset_cached_links_and_joints()
         if is_virtual:
             self.virtual_joint_names.append(name)
 
@@ -262,7 +267,7 @@ class ObjectDescription(AbstractObjectDescription):
             with suppress_stdout_stderr():
                 return URDF.from_xml_string(file.read())
 
-    def generate_from_mesh_file(self, path: str, name: str, save_path: str, color: Optional[Color] = Color(), scale = Optional[float]) -> None:
+    def generate_from_mesh_file(self, path: str, name: str, save_path: str, color: Optional[Color] = Color(), scale: Optional[float] = 1.0) -> None:
         """
         Generate a URDf file with the given .obj or .stl file as mesh. In addition, use the given rgba_color to create a
          material tag in the URDF. The URDF file will be saved to the given save_path.
@@ -308,7 +313,6 @@ class ObjectDescription(AbstractObjectDescription):
         urdf_string = self.fix_link_attributes(urdf_string)
         try:
             urdf_string = self.replace_relative_references_with_absolute_paths(urdf_string)
-            urdf_string = self.fix_missing_inertial(urdf_string)
         except ResourceNotFound as e:
             logerr(f"Could not find resource package linked in this URDF")
             raise e
@@ -361,8 +365,8 @@ class ObjectDescription(AbstractObjectDescription):
                 link = child
         return link
 
-    def get_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
-                  links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
+    def compute_chain(self, start_link_name: str, end_link_name: str, joints: Optional[bool] = True,
+                      links: Optional[bool] = True, fixed: Optional[bool] = True) -> List[str]:
         """
         :param start_link_name: The name of the start link of the chain.
         :param end_link_name: The name of the end link of the chain.
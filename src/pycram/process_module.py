@@ -294,7 +294,7 @@ class ProcessModuleManager(ABC):
         """
         manager = None
         _default_manager = None
-        if not ProcessModuleManager.execution_type:
+        if ProcessModuleManager.execution_type is None:
             logerr(
                 f"No execution_type is set, did you use the with_simulated_robot or with_real_robot decorator?")
             return
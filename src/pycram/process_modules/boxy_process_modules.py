@@ -36,14 +36,14 @@ class BoxyOpen(ProcessModule):
 
         container_joint = part_of_object.find_joint_above(desig.object_part.name, JointType.PRISMATIC)
 
+        upper_limit = part_of_object.get_joint_limits(container_joint)[1]
+
         goal_pose = btr.link_pose_for_joint_config(part_of_object, {
-            container_joint: part_of_object.get_joint_limits(container_joint)[1] - 0.05}, desig.object_part.name)
+            container_joint: upper_limit - 0.05}, desig.object_part.name)
 
         _move_arm_tcp(goal_pose, World.robot, desig.arm)
 
-        desig.object_part.world_object.set_joint_position(container_joint,
-                                                              part_of_object.get_joint_limits(
-                                                                  container_joint)[1])
+        part_of_object.set_joint_position(container_joint, upper_limit)
 
 
 class BoxyClose(ProcessModule):
@@ -55,14 +55,14 @@ class BoxyClose(ProcessModule):
 
         container_joint = part_of_object.find_joint_above(desig.object_part.name, JointType.PRISMATIC)
 
+        lower_limit = part_of_object.get_joint_limits(container_joint)[0]
+
         goal_pose = btr.link_pose_for_joint_config(part_of_object, {
-            container_joint: part_of_object.get_joint_limits(container_joint)[0]}, desig.object_part.name)
+            container_joint: lower_limit}, desig.object_part.name)
 
         _move_arm_tcp(goal_pose, World.robot, desig.arm)
 
-        desig.object_part.world_object.set_joint_position(container_joint,
-                                                              part_of_object.get_joint_limits(
-                                                                  container_joint)[0])
+        part_of_object.set_joint_position(container_joint, lower_limit)
 
 
 class BoxyParkArms(ProcessModule):
@@ -179,9 +179,7 @@ class BoxyWorldStateDetecting(ProcessModule):
 
 
 def _move_arm_tcp(target: Pose, robot: Object, arm: Arms) -> None:
-    gripper = RobotDescription.current_robot_description.get_arm_chain(arm).get_tool_frame()
-
-    joints = RobotDescription.current_robot_description.get_arm_chain(arm).joints
+    gripper, joints = RobotDescription.current_robot_description.get_arm_ik_chain(arm)
 
     inv = request_ik(target, robot, joints, gripper)
     _apply_ik(robot, inv)
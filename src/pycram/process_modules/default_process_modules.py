@@ -1,8 +1,9 @@
 import inspect
+import math
+from threading import Lock
 
 import numpy as np
-import rospy
-from typing_extensions import List, TYPE_CHECKING
+from typing_extensions import List, Tuple, Optional, Dict, Type, TYPE_CHECKING
 
 from pycrap import *
 from ..datastructures.enums import JointType
@@ -10,10 +11,7 @@ from ..datastructures.world import World
 from ..designators.motion_designator import *
 from ..external_interfaces import giskard
 from ..external_interfaces.ik import request_ik
-from ..external_interfaces.move_base import query_pose_nav
-from ..external_interfaces.robokudo import query_all_objects, query_object, query_human, query_specific_region, \
-    query_human_attributes, query_waving_human
-from ..failures import NavigationGoalNotReachedError
+from ..failures import NavigationGoalNotReachedError, PerceptionObjectNotInWorld
 from ..local_transformer import LocalTransformer
 from ..object_descriptors.generic import ObjectDescription as GenericObjectDescription
 from ..process_module import ProcessModule
@@ -23,7 +21,7 @@ from ..ros.logging import logdebug, loginfo, logwarn
 from ..ros.ros_tools import get_time
 from ..utils import _apply_ik, map_color_names_to_rgba
 from ..world_concepts.world_object import Object
-from ..world_reasoning import visible, link_pose_for_joint_config
+from ..world_reasoning import visible_objects, link_pose_for_joint_config
 
 if TYPE_CHECKING:
     from ..designators.object_designator import ObjectDesignatorDescription
@@ -49,12 +47,10 @@ class DefaultMoveHead(ProcessModule):
         target = desig.target
         robot = World.robot
 
-        local_transformer = LocalTransformer()
-        pose_in_pan = local_transformer.transform_pose(target, robot.get_link_tf_frame("head_pan_link"))
-        pose_in_tilt = local_transformer.transform_pose(target, robot.get_link_tf_frame("head_tilt_link"))
+        position_in_pan, position_in_tilt = _get_target_position_in_head_links(target, robot)
 
-        new_pan = np.arctan2(pose_in_pan.position.y, pose_in_pan.position.x)
-        new_tilt = np.arctan2(pose_in_tilt.position.z, pose_in_tilt.position.x ** 2 + pose_in_tilt.position.y ** 2) * -1
+        new_pan = math.atan2(position_in_pan[1], position_in_pan[0])
+        new_tilt = -math.atan2(position_in_tilt[2], math.hypot(position_in_tilt[0], position_in_tilt[1]))
 
         current_pan = robot.get_joint_position("head_pan_joint")
         current_tilt = robot.get_joint_position("head_tilt_joint")
@@ -94,16 +90,13 @@ class DefaultDetecting(ProcessModule):
         camera_description = RobotDescription.current_robot_description.cameras[
             list(RobotDescription.current_robot_description.cameras.keys())[0]]
         front_facing_axis = camera_description.front_facing_axis
-        query_result = []
         world_objects = []
         try:
             object_types = designator.object_designator_description.types
         except AttributeError:
             object_types = None
         if designator.technique == DetectionTechnique.TYPES:
-            for obj_type in object_types:
-                list1 = World.current_world.get_object_by_type(obj_type)
-                world_objects = world_objects + list1
+            world_objects = World.current_world.get_objects_by_types(object_types)
         elif designator.technique == DetectionTechnique.ALL:
             world_objects = World.current_world.get_scene_objects()
         elif designator.technique == DetectionTechnique.HUMAN:
@@ -114,20 +107,12 @@ class DefaultDetecting(ProcessModule):
             raise NotImplementedError("Detection by human attributes is not yet implemented in simulation")
         elif designator.technique == DetectionTechnique.HUMAN_WAVING:
             raise NotImplementedError("Detection by waving human is not yet implemented in simulation")
-        for obj in world_objects:
-            if visible(obj, robot.get_link_pose(cam_link_name), front_facing_axis):
-                query_result.append(obj)
+        query_result = visible_objects(world_objects, robot.get_link_pose(cam_link_name), front_facing_axis)
         if query_result is None:
             raise PerceptionObjectNotFound(
                 f"Could not find an object with the type {object_types} in the FOV of the robot")
         else:
-            object_dict = []
-
-            for obj in query_result:
-                object_dict.append(ObjectDesignatorDescription.Object(obj.name, obj.obj_type,
-                                                   obj))
-
-            return object_dict
+            return [ObjectDesignatorDescription.Object(obj.name, obj.obj_type, obj) for obj in query_result]
 
 
 class DefaultMoveTCP(ProcessModule):
@@ -151,19 +136,18 @@ class DefaultMoveArmJoints(ProcessModule):
     def _execute(self, desig: MoveArmJointsMotion):
 
         robot = World.robot
+        joint_positions = {}
         if desig.right_arm_poses:
-            for joint, pose in desig.right_arm_poses.items():
-                robot.set_joint_position(joint, pose)
+            joint_positions.update(desig.right_arm_poses)
         if desig.left_arm_poses:
-            for joint, pose in desig.left_arm_poses.items():
-                robot.set_joint_position(joint, pose)
+            joint_positions.update(desig.left_arm_poses)
+        robot.set_multiple_joint_positions(joint_positions)
 
 
 class DefaultMoveJoints(ProcessModule):
     def _execute(self, desig: MoveJointsMotion):
         robot = World.robot
-        for joint, pose in zip(desig.names, desig.positions):
-            robot.set_joint_position(joint, pose)
+        robot.set_multiple_joint_positions(dict(zip(desig.names, desig.positions)))
 
 
 class DefaultWorldStateDetecting(ProcessModule):
@@ -173,7 +157,10 @@ class DefaultWorldStateDetecting(ProcessModule):
 
     def _execute(self, desig: WorldStateDetectingMotion):
         obj_type = desig.object_type
-        return list(filter(lambda obj: obj.obj_type == obj_type, World.current_world.objects))[0]
+        obj = next((obj for obj in World.current_world.objects if obj.obj_type == obj_type), None)
+        if obj is None:
+            raise PerceptionObjectNotInWorld(f"Could not find an object with the type {obj_type} in the world")
+        return obj
 
 
 class DefaultOpen(ProcessModule):
@@ -192,7 +179,7 @@ class DefaultOpen(ProcessModule):
 
         _move_arm_tcp(goal_pose, World.robot, desig.arm)
 
-        desig.object_part.world_object.set_joint_position(container_joint_name, upper_limit)
+        part_of_object.set_joint_position(container_joint_name, upper_limit)
 
 
 class DefaultClose(ProcessModule):
@@ -211,13 +198,31 @@ class DefaultClose(ProcessModule):
 
         _move_arm_tcp(goal_pose, World.robot, desig.arm)
 
-        desig.object_part.world_object.set_joint_position(container_joint_name, lower_joint_limit)
+        part_of_object.set_joint_position(container_joint_name, lower_joint_limit)
 
 
-def _move_arm_tcp(target: Pose, robot: Object, arm: Arms) -> None:
-    gripper = RobotDescription.current_robot_description.get_arm_chain(arm).get_tool_frame()
+def _get_target_position_in_head_links(target: Pose, robot: Object) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the position of a look at target in the frames of the head pan and head tilt links. The target is transformed
+    to the map frame once, the positions in the link frames are then computed from the link poses of the robot instead
+    of doing a TF lookup for each link.
+
+    :param target: The pose to look at.
+    :param robot: The robot which has the head pan and head tilt links.
+    :return: The position of the target in the head pan link frame and in the head tilt link frame.
+    """
+    target_in_map = LocalTransformer().transform_pose(target, "map")
+    target_position = np.array(target_in_map.position_as_list())
+    positions = []
+    for link_name in ("head_pan_link", "head_tilt_link"):
+        link_matrix = robot.get_link_pose(link_name).get_homogeneous_matrix()
+        # The inverse of a rigid transform [R, t] is [R^T, -R^T t], so no general matrix inversion is needed.
+        positions.append(link_matrix[:3, :3].T @ (target_position - link_matrix[:3, 3]))
+    return positions[0], positions[1]
 
-    joints = RobotDescription.current_robot_description.get_arm_chain(arm).joints
+
+def _move_arm_tcp(target: Pose, robot: Object, arm: Arms) -> None:
+    gripper, joints = RobotDescription.current_robot_description.get_arm_ik_chain(arm)
 
     inv = request_ik(target, robot, joints, gripper)
     _apply_ik(robot, inv)
@@ -227,6 +232,22 @@ def _move_arm_tcp(target: Pose, robot: Object, arm: Arms) -> None:
 ########## Process Modules for the Real     ###############
 ###########################################################
 
+_object_class_names: Optional[List[str]] = None
+"""
+The names of the classes in the objects module (pycrap), collected on first use by :func:`_get_object_class_names`.
+"""
+
+
+def _get_object_class_names() -> List[str]:
+    """
+    :return: The names of the classes in the objects module (pycrap), the module is only inspected on the first call.
+    """
+    global _object_class_names
+    if _object_class_names is None:
+        _object_class_names = [name for name, obj in inspect.getmembers(objects, inspect.isclass)]
+    return _object_class_names
+
+
 class DefaultDetectingReal(ProcessModule):
     def _execute(self, designator: DetectingMotion) -> List[Object]:
         """
@@ -234,6 +255,9 @@ class DefaultDetectingReal(ProcessModule):
 
             :return: A list of perceived objects.
             """
+        from ..external_interfaces.robokudo import query_all_objects, query_object, query_human, \
+            query_specific_region, query_human_attributes, query_waving_human
+
         object_designator_description = designator.object_designator_description
         query_methods = {
             DetectionTechnique.TYPES: lambda: query_object(object_designator_description),
@@ -250,38 +274,25 @@ class DefaultDetectingReal(ProcessModule):
                 f"Could not find an object in the FOV of the robot")
         else:
             perceived_objects = []
-            for i in range(0, len(query_result.res)):
-                try:
-                    obj_pose = Pose.from_pose_stamped(query_result.res[i].pose[0])
-                except IndexError:
-                    obj_pose = Pose.from_pose_stamped(query_result.res[i].pose)
-                    pass
-                obj_type = query_result.res[i].type
-                obj_size = None
-                try:
-                    obj_size = query_result.res[i].shape_size[0].dimensions
-                except IndexError:
-                    pass
-                obj_color = None
-                try:
-                    obj_color = query_result.res[i].color[0]
-                except IndexError:
-                    pass
-
-                hsize = [obj_size.x / 2, obj_size.y / 2, obj_size.z / 2]
+            class_names = _get_object_class_names()
+            sizes = np.array([[size.x, size.y, size.z] for size in
+                              (result.shape_size[0].dimensions for result in query_result.res)], dtype=np.float64)
+            half_sizes = (sizes * 0.5).tolist()
+            for result, hsize in zip(query_result.res, half_sizes):
+                obj_pose = Pose.from_pose_stamped(result.pose[0] if result.pose else result.pose)
+                obj_type = result.type
+                obj_color = result.color[0] if result.color else None
 
                 # Check if the object type is a subclass of the classes in the objects module (pycrap)
-                class_names = [name for name, obj in inspect.getmembers(objects, inspect.isclass)]
-
                 matching_classes = [class_name for class_name in class_names if obj_type in class_name]
 
                 obj_name = obj_type + "" + str(get_time())
                 # Check if there are any matches
                 if matching_classes:
-                    rospy.loginfo(f"Matching class names: {matching_classes}")
+                    loginfo(f"Matching class names: {matching_classes}")
                     obj_type = matching_classes[0]
                 else:
-                    rospy.loginfo(f"No class name contains the string '{obj_type}'")
+                    loginfo(f"No class name contains the string '{obj_type}'")
                     obj_type = Genobj
                 gen_obj_desc = GenericObjectDescription(obj_name, [0, 0, 0], hsize)
                 color = map_color_names_to_rgba(obj_color)
@@ -291,13 +302,7 @@ class DefaultDetectingReal(ProcessModule):
 
                 perceived_objects.append(generic_obj)
 
-            object_dict = []
-
-            for obj in perceived_objects:
-                object_dict.append(ObjectDesignatorDescription.Object(obj.name, obj.obj_type,
-                                                                      obj))
-
-            return object_dict
+            return [ObjectDesignatorDescription.Object(obj.name, obj.obj_type, obj) for obj in perceived_objects]
 
 class DefaultNavigationReal(ProcessModule):
     """
@@ -305,6 +310,10 @@ class DefaultNavigationReal(ProcessModule):
     """
 
     def _execute(self, designator: MoveMotion):
+        if World.current_world.robot.pose.almost_equal(designator.target, 0.05, 3):
+            logdebug("Robot is already at the navigation goal, not sending a goal to movebase")
+            return
+        from ..external_interfaces.move_base import query_pose_nav
         logdebug(f"Sending goal to movebase to Move the robot")
         query_pose_nav(designator.target)
         if not World.current_world.robot.pose.almost_equal(designator.target, 0.05, 3):
@@ -320,19 +329,16 @@ class DefaultMoveHeadReal(ProcessModule):
         target = desig.target
         robot = World.robot
 
-        local_transformer = LocalTransformer()
-        pose_in_pan = local_transformer.transform_pose(target, robot.get_link_tf_frame("head_pan_link"))
-        pose_in_tilt = local_transformer.transform_pose(target, robot.get_link_tf_frame("head_tilt_link"))
+        position_in_pan, position_in_tilt = _get_target_position_in_head_links(target, robot)
 
-        new_pan = np.arctan2(pose_in_pan.position.y, pose_in_pan.position.x)
-        new_tilt = np.arctan2(pose_in_tilt.position.z, np.sqrt(pose_in_tilt.position.x ** 2 + pose_in_tilt.position.y ** 2)) * -1
+        new_pan = math.atan2(position_in_pan[1], position_in_pan[0])
+        new_tilt = -math.atan2(position_in_tilt[2], math.hypot(position_in_tilt[0], position_in_tilt[1]))
 
         current_pan = robot.get_joint_position("head_pan_joint")
         current_tilt = robot.get_joint_position("head_tilt_joint")
 
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal({"head_pan_joint": new_pan + current_pan,
-                                    "head_tilt_joint": new_tilt + current_tilt})
+        giskard.achieve_joint_goal_collision_free({"head_pan_joint": new_pan + current_pan,
+                                                      "head_tilt_joint": new_tilt + current_tilt})
 
 
 class DefaultMoveTCPReal(ProcessModule):
@@ -344,6 +350,9 @@ class DefaultMoveTCPReal(ProcessModule):
         lt = LocalTransformer()
         pose_in_map = lt.transform_pose(designator.target, "map")
         tip_link = RobotDescription.current_robot_description.get_arm_chain(designator.arm).get_tool_frame()
+        if World.current_world.robot.get_link_pose(tip_link).almost_equal(pose_in_map, 0.01, 3):
+            logdebug(f"Tool frame {tip_link} is already at the target pose, not sending a goal to giskard")
+            return
         root_link = "map"
 
         gripper_that_can_collide = designator.arm if designator.allow_gripper_collision else None
@@ -371,13 +380,8 @@ class DefaultMoveArmJointsReal(ProcessModule):
     """
 
     def _execute(self, designator: MoveArmJointsMotion):
-        joint_goals = {}
-        if designator.left_arm_poses:
-            joint_goals.update(designator.left_arm_poses)
-        if designator.right_arm_poses:
-            joint_goals.update(designator.right_arm_poses)
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(joint_goals)
+        joint_goals = {**(designator.left_arm_poses or {}), **(designator.right_arm_poses or {})}
+        giskard.achieve_joint_goal_collision_free(joint_goals)
 
 
 class DefaultMoveJointsReal(ProcessModule):
@@ -387,8 +391,7 @@ class DefaultMoveJointsReal(ProcessModule):
 
     def _execute(self, designator: MoveJointsMotion):
         name_to_position = dict(zip(designator.names, designator.positions))
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(name_to_position)
+        giskard.achieve_joint_goal_collision_free(name_to_position)
 
 
 class DefaultMoveGripperReal(ProcessModule):
@@ -426,62 +429,71 @@ class DefaultManager(ProcessModuleManager):
 
     def __init__(self):
         super().__init__("default")
+        self._process_modules: Dict[str, Tuple[Lock, Dict[ExecutionType, Type[ProcessModule]]]] = {
+            "navigate": (self._navigate_lock, {ExecutionType.SIMULATED: DefaultNavigation,
+                                               ExecutionType.REAL: DefaultNavigationReal}),
+            "looking": (self._looking_lock, {ExecutionType.SIMULATED: DefaultMoveHead,
+                                             ExecutionType.REAL: DefaultMoveHeadReal}),
+            "detecting": (self._detecting_lock, {ExecutionType.SIMULATED: DefaultDetecting,
+                                                 ExecutionType.REAL: DefaultDetectingReal}),
+            "move_tcp": (self._move_tcp_lock, {ExecutionType.SIMULATED: DefaultMoveTCP,
+                                               ExecutionType.REAL: DefaultMoveTCPReal}),
+            "move_arm_joints": (self._move_arm_joints_lock, {ExecutionType.SIMULATED: DefaultMoveArmJoints,
+                                                             ExecutionType.REAL: DefaultMoveArmJointsReal}),
+            "world_state_detecting": (self._world_state_detecting_lock,
+                                      {ExecutionType.SIMULATED: DefaultWorldStateDetecting,
+                                       ExecutionType.REAL: DefaultWorldStateDetecting}),
+            "move_joints": (self._move_joints_lock, {ExecutionType.SIMULATED: DefaultMoveJoints,
+                                                     ExecutionType.REAL: DefaultMoveJointsReal}),
+            "move_gripper": (self._move_gripper_lock, {ExecutionType.SIMULATED: DefaultMoveGripper,
+                                                       ExecutionType.REAL: DefaultMoveGripperReal}),
+            "open": (self._open_lock, {ExecutionType.SIMULATED: DefaultOpen,
+                                       ExecutionType.REAL: DefaultOpenReal}),
+            "close": (self._close_lock, {ExecutionType.SIMULATED: DefaultClose,
+                                         ExecutionType.REAL: DefaultCloseReal}),
+        }
+        """
+        The lock and the process module class per execution type for each designator type, such that the process
+        module for the current execution type is found with dict lookups.
+        """
+
+    def _get_process_module(self, name: str) -> Optional[ProcessModule]:
+        """
+        Create the process module for the given designator type and the current execution type.
+
+        :param name: The name of the designator type, e.g. "navigate"
+        :return: The process module, or None if there is none for the current execution type
+        """
+        lock, process_modules = self._process_modules[name]
+        process_module = process_modules.get(ProcessModuleManager.execution_type)
+        return process_module(lock) if process_module is not None else None
 
     def navigate(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultNavigation(self._navigate_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultNavigationReal(self._navigate_lock)
+        return self._get_process_module("navigate")
 
     def looking(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultMoveHead(self._looking_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultMoveHeadReal(self._looking_lock)
+        return self._get_process_module("looking")
 
     def detecting(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultDetecting(self._detecting_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultDetectingReal(self._detecting_lock)
+        return self._get_process_module("detecting")
 
     def move_tcp(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultMoveTCP(self._move_tcp_lock)
-        elif ProcessModuleManager.execution_type == "real":
-            return DefaultMoveTCPReal(self._move_tcp_lock)
+        return self._get_process_module("move_tcp")
 
     def move_arm_joints(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultMoveArmJoints(self._move_arm_joints_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultMoveArmJointsReal(self._move_arm_joints_lock)
+        return self._get_process_module("move_arm_joints")
 
     def world_state_detecting(self):
-        if (ProcessModuleManager.execution_type == ExecutionType.SIMULATED or
-                ProcessModuleManager.execution_type == ExecutionType.REAL):
-            return DefaultWorldStateDetecting(self._world_state_detecting_lock)
+        return self._get_process_module("world_state_detecting")
 
     def move_joints(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultMoveJoints(self._move_joints_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultMoveJointsReal(self._move_joints_lock)
+        return self._get_process_module("move_joints")
 
     def move_gripper(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultMoveGripper(self._move_gripper_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultMoveGripperReal(self._move_gripper_lock)
+        return self._get_process_module("move_gripper")
 
     def open(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultOpen(self._open_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultOpenReal(self._open_lock)
+        return self._get_process_module("open")
 
     def close(self):
-        if ProcessModuleManager.execution_type == ExecutionType.SIMULATED:
-            return DefaultClose(self._close_lock)
-        elif ProcessModuleManager.execution_type == ExecutionType.REAL:
-            return DefaultCloseReal(self._close_lock)
+        return self._get_process_module("close")
@@ -73,8 +73,7 @@ class HSRBMoveArmJointsReal(ProcessModule):
         joint_goals = {}
         if designator.left_arm_poses:
             joint_goals.update(designator.left_arm_poses)
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(joint_goals)
+        giskard.achieve_joint_goal_collision_free(joint_goals)
 
 
 class HSRBMoveJointsReal(ProcessModule):
@@ -84,8 +83,7 @@ class HSRBMoveJointsReal(ProcessModule):
 
     def _execute(self, designator: MoveJointsMotion) -> Any:
         name_to_position = dict(zip(designator.names, designator.positions))
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(name_to_position)
+        giskard.achieve_joint_goal_collision_free(name_to_position)
 
 
 class HSRBMoveGripperReal(ProcessModule):
@@ -41,14 +41,14 @@ class StretchOpen(ProcessModule):
 
         container_joint = part_of_object.find_joint_above(desig.object_part.name, JointType.PRISMATIC)
 
+        upper_limit = part_of_object.get_joint_limits(container_joint)[1]
+
         goal_pose = link_pose_for_joint_config(part_of_object, {
-            container_joint: part_of_object.get_joint_limits(container_joint)[1] - 0.05}, desig.object_part.name)
+            container_joint: upper_limit - 0.05}, desig.object_part.name)
 
         _move_arm_tcp(goal_pose, World.robot, desig.arm)
 
-        desig.object_part.world_object.set_joint_position(container_joint,
-                                                              part_of_object.get_joint_limits(
-                                                                  container_joint)[1] - 0.05)
+        part_of_object.set_joint_position(container_joint, upper_limit - 0.05)
 
 
 class StretchClose(ProcessModule):
@@ -61,14 +61,14 @@ class StretchClose(ProcessModule):
 
         container_joint = part_of_object.find_joint_above(desig.object_part.name, JointType.PRISMATIC)
 
+        lower_limit = part_of_object.get_joint_limits(container_joint)[0]
+
         goal_pose = link_pose_for_joint_config(part_of_object, {
-            container_joint: part_of_object.get_joint_limits(container_joint)[0]}, desig.object_part.name)
+            container_joint: lower_limit}, desig.object_part.name)
 
         _move_arm_tcp(goal_pose, World.robot, desig.arm)
 
-        desig.object_part.world_object.set_joint_position(container_joint,
-                                                       part_of_object.get_joint_limits(
-                                                           container_joint)[0])
+        part_of_object.set_joint_position(container_joint, lower_limit)
 
 
 def _move_arm_tcp(target: Pose, robot: Object, arm: Arms) -> None:
@@ -113,15 +113,13 @@ class StretchMoveHeadReal(ProcessModule):
         current_pan = robot.get_joint_position("joint_head_pan")
         current_tilt = robot.get_joint_position("joint_head_tilt")
 
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal({"head_pan_joint": new_pan + current_pan})
+        giskard.achieve_joint_goal_collision_free({"head_pan_joint": new_pan + current_pan})
 
         pose_in_tilt = local_transformer.transform_pose(target, robot.get_link_tf_frame("head_tilt_link"))
         new_tilt = np.arctan2(-pose_in_tilt.position.y,
                               np.sqrt(pose_in_tilt.position.z ** 2 + pose_in_tilt.position.x ** 2)) * -1
         current_tilt = robot.get_joint_position("joint_head_tilt")
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal({"head_tilt_joint": new_tilt + current_tilt})
+        giskard.achieve_joint_goal_collision_free({"head_tilt_joint": new_tilt + current_tilt})
 
 
 class StretchDetectingReal(ProcessModule):
@@ -180,8 +178,7 @@ class StretchMoveArmJointsReal(ProcessModule):
             joint_goals.update(designator.left_arm_poses)
         if designator.right_arm_poses:
             joint_goals.update(designator.right_arm_poses)
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(joint_goals)
+        giskard.achieve_joint_goal_collision_free(joint_goals)
 
 
 class StretchMoveJointsReal(ProcessModule):
@@ -191,8 +188,7 @@ class StretchMoveJointsReal(ProcessModule):
 
     def _execute(self, designator: MoveJointsMotion) -> Any:
         name_to_position = dict(zip(designator.names, designator.positions))
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(name_to_position)
+        giskard.achieve_joint_goal_collision_free(name_to_position)
 
 
 class StretchMoveGripperReal(ProcessModule):
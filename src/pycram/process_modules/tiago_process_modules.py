@@ -46,9 +46,8 @@ class TiagoMoveHeadReal(ProcessModule):
         current_pan = robot.get_joint_position(pan_joint)
         current_tilt = robot.get_joint_position(tilt_joint)
 
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal({pan_link: new_pan + current_pan,
-                                    tilt_link: new_tilt + current_tilt})
+        giskard.achieve_joint_goal_collision_free({pan_link: new_pan + current_pan,
+                                                      tilt_link: new_tilt + current_tilt})
 
 class TiagoDetectingReal(ProcessModule):
     def _execute(self, designator: DetectingMotion):
@@ -92,14 +91,12 @@ class TiagoMoveArmJointsReal(ProcessModule):
             joint_goals.update(designator.left_arm_poses)
         if designator.right_arm_poses:
             joint_goals.update(designator.right_arm_poses)
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(joint_goals)
+        giskard.achieve_joint_goal_collision_free(joint_goals)
 
 class TiagoMoveJointsReal(ProcessModule):
     def _execute(self, designator: MoveJointsMotion):
         name_to_position = dict(zip(designator.names, designator.positions))
-        giskard.avoid_all_collisions()
-        giskard.achieve_joint_goal(name_to_position)
+        giskard.achieve_joint_goal_collision_free(name_to_position)
 
 class TiagoOpenReal(ProcessModule):
     def _execute(self, designator: OpeningMotion):
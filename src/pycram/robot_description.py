@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from enum import Enum
 
-from typing_extensions import List, Dict, Union, Optional
+from typing_extensions import List, Dict, Union, Optional, Tuple, FrozenSet
 
 from .datastructures.dataclasses import VirtualMobileBaseJoints
 from .datastructures.enums import Arms, Grasp, GripperState, GripperType, JointType
@@ -42,6 +42,8 @@ class RobotDescriptionManager:
         :param name: Name of the robot to which the description should be loaded.
         :return: The loaded robot description.
         """
+        from .robot_descriptions import load_robot_descriptions
+        load_robot_descriptions()
         if name in self.descriptions.keys():
             RobotDescription.current_robot_description = self.descriptions[name]
             return self.descriptions[name]
@@ -154,6 +156,9 @@ class RobotDescription:
         self.joint_types = {joint.name: joint.type for joint in self.urdf_object.joints}
         self.joint_actuators: Optional[Dict] = parse_mjcf_actuators(mjcf_path) if mjcf_path is not None else None
         self.kinematic_chains: Dict[str, KinematicChainDescription] = {}
+        self._arm_chains: Dict[Arms, KinematicChainDescription] = {}
+        self._arm_ik_chains: Dict[Arms, Tuple[str, List[str]]] = {}
+        self._gripper_link_sets: Optional[List[FrozenSet[str]]] = None
         self.cameras: Dict[str, CameraDescription] = {}
         self.grasps: Dict[Grasp, List[float]] = {}
         self.links: List[str] = [l.name for l in self.urdf_object.links]
@@ -191,6 +196,9 @@ class RobotDescription:
         if chain.name in self.kinematic_chains.keys():
             raise ValueError(f"Chain {chain.name} already exists for robot {self.name}")
         self.kinematic_chains[chain.name] = chain
+        self._gripper_link_sets = None
+        if chain.arm_type is not None:
+            self._arm_chains.setdefault(chain.arm_type, chain)
 
     def add_kinematic_chain(self, name: str, start_link: str, end_link: str):
         """
@@ -261,6 +269,17 @@ class RobotDescription:
                 result.append(chain)
         return result
 
+    def get_gripper_link_sets(self) -> List[FrozenSet[str]]:
+        """
+        Get the names of the links of the end effector of each manipulator chain, one set per chain. The sets are
+        computed on the first call and reused until another kinematic chain is added.
+
+        :return: A list of sets of link names, one for each manipulator chain
+        """
+        if self._gripper_link_sets is None:
+            self._gripper_link_sets = [frozenset(chain.end_effector.links) for chain in self.get_manipulator_chains()]
+        return self._gripper_link_sets
+
     def get_camera_frame(self, robot_object_name: str) -> str:
         """
         Quick method to get the name of a link of a camera. Uses the first camera in the list of cameras.
@@ -364,6 +383,20 @@ class RobotDescription:
         chain = self.get_arm_chain(arm)
         return chain.get_tool_frame()
 
+    def get_arm_ik_chain(self, arm: Arms) -> Tuple[str, List[str]]:
+        """
+        Get the tool frame and the joints of a specific arm, which are the inputs of an inverse kinematics request for
+        that arm. The result is computed on the first call for each arm and reused afterwards.
+
+        :param arm: Arm for which the tool frame and joints should be returned
+        :return: A tuple of the name of the tool frame and the names of the joints of the arm
+        """
+        try:
+            return self._arm_ik_chains[arm]
+        except KeyError:
+            chain = self.get_arm_chain(arm)
+            return self._arm_ik_chains.setdefault(arm, (chain.get_tool_frame(), chain.joints))
+
     def get_arm_chain(self, arm: Arms) -> Union[KinematicChainDescription, List[KinematicChainDescription]]:
         """
         Get the kinematic chain of a specific arm. If the arm is set to BOTH, all kinematic chains are returned.
@@ -373,10 +406,10 @@ class RobotDescription:
         """
         if arm == Arms.BOTH:
             return list(filter(lambda chain: chain.arm_type is not None, self.kinematic_chains.values()))
-        for chain in self.kinematic_chains.values():
-            if chain.arm_type == arm:
-                return chain
-        raise ValueError(f"There is no Kinematic Chain for the Arm {arm}")
+        try:
+            return self._arm_chains[arm]
+        except KeyError:
+            raise ValueError(f"There is no Kinematic Chain for the Arm {arm}") from None
 
 
 class KinematicChainDescription:
@@ -5,11 +5,36 @@ import importlib
 modules = glob.glob(join(dirname(__file__), "*.py"))
 __all__ = [basename(f)[:-3] for f in modules if isfile(f) and not f.endswith('__init__.py')]
 
-for module_name in __all__:
-    try:
-        importlib.import_module(f".{module_name}", package=__name__)
-    except Exception as e:
-        print(f"Error loading module {module_name}: {e}")
+_descriptions_loaded = False
+"""
+True if all robot description modules were imported by :func:`load_robot_descriptions`.
+"""
+
+
+def load_robot_descriptions() -> None:
+    """
+    Import all robot description modules, each module registers its robot description at the RobotDescriptionManager
+    when it is imported. Since every module parses the URDF of its robot, this is done when a robot description is
+    loaded for the first time instead of when pycram is imported.
+    """
+    global _descriptions_loaded
+    if _descriptions_loaded:
+        return
+    _descriptions_loaded = True
+    for module_name in __all__:
+        try:
+            importlib.import_module(f".{module_name}", package=__name__)
+        except Exception as e:
+            print(f"Error loading module {module_name}: {e}")
+
+
+def __getattr__(name: str):
+    """
+    Import a robot description module when it is accessed as an attribute of this package.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", package=__name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class DeprecatedRobotDescription:
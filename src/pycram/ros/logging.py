@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import logging
+import sys
+
 import rospy
 from rospy.logger_level_service_caller import LoggerLevelServiceCaller
-import inspect
 from pathlib import Path
 
 from typing_extensions import TYPE_CHECKING
@@ -13,38 +15,35 @@ if TYPE_CHECKING:
 
 PYCRAM_LOGGER_NAME = "pycram"
 logger_level_service_caller = LoggerLevelServiceCaller()
+_pycram_logger = logging.getLogger(f"rosout.{PYCRAM_LOGGER_NAME}")
+"""
+The python logger behind the pycram rospy logger, used to skip building messages for levels that are not logged.
+"""
 
 
-
-def _get_caller_method_name():
-    """
-    Get the name of the method that called the function from which this function is called. It is intended as a helper
-    function for the log functions.
-
-    :return: Name of the method that called the function from which this function is called.
-    """
-    return inspect.stack()[2][3]
-
-
-def _get_caller_method_line():
+def _get_caller_prefix() -> str:
     """
-    Get the line of the method that called the function from which this function is called. It is intended as a helper
-    function for the log functions.
+    Get the prefix of a log message, which consists of the file name, line and method name of the caller of the log
+    function from which this function is called. Unlike inspect.stack() this only looks up the one needed frame and does
+    not read any source files.
 
-    :return: Line number of the method that called the function from which this function is called.
+    :return: The prefix of the log message.
     """
-    return inspect.stack()[2][2]
+    frame = sys._getframe(2)
+    code = frame.f_code
+    return f"[{Path(code.co_filename).name}:{frame.f_lineno}:{code.co_name}]"
 
 
-def _get_caller_file_name():
+def _format_message(message: str, args: tuple) -> str:
     """
-    Get the file name of the method that called the function from which this function is called. It is intended as a helper
-    function for the log functions.
+    Format a log message with %-style arguments, such that callers can pass the arguments instead of building the
+    message themselves. The log functions only call this if their level is enabled.
 
-    :return: File name of the method that called the function from which this function is called.
+    :param message: The message, containing a %-style placeholder for each argument.
+    :param args: The arguments of the message, if there are none the message is used as is.
+    :return: The formatted message.
     """
-    path = Path(inspect.stack()[2][1])
-    return path.name
+    return message % args if args else message
 
 
 def set_logger_level(level: LoggerLevel):
@@ -60,42 +59,41 @@ def set_logger_level(level: LoggerLevel):
                                                            level.value)
 
 
-def logwarn(message: str):
-    rospy.logwarn(f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-                  logger_name=PYCRAM_LOGGER_NAME)
+def logwarn(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.WARNING):
+        rospy.logwarn(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
 
 
-def loginfo(message: str):
-    rospy.loginfo(f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-                  logger_name=PYCRAM_LOGGER_NAME)
+def loginfo(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.INFO):
+        rospy.loginfo(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
 
 
-def logerr(message: str):
-    rospy.logerr(f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-                 logger_name=PYCRAM_LOGGER_NAME)
+def logerr(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.ERROR):
+        rospy.logerr(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
 
 
-def logdebug(message: str):
-    rospy.logdebug(f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-                   logger_name=PYCRAM_LOGGER_NAME)
+def logdebug(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.DEBUG):
+        rospy.logdebug(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
 
 
-def logwarn_once(message: str):
-    rospy.logwarn_once(f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-                       logger_name=PYCRAM_LOGGER_NAME)
+def logwarn_once(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.WARNING):
+        rospy.logwarn_once(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
 
 
-def loginfo_once(message: str):
-    rospy.loginfo_once(f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-                       logger_name=PYCRAM_LOGGER_NAME)
+def loginfo_once(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.INFO):
+        rospy.loginfo_once(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
 
 
-def logerr_once(message: str):
-    rospy.logerr_once(f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-                      logger_name=PYCRAM_LOGGER_NAME)
+def logerr_once(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.ERROR):
+        rospy.logerr_once(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
 
 
-def logdebug_once(message: str):
-    rospy.logdebug_once(
-        f"[{_get_caller_file_name()}:{_get_caller_method_line()}:{_get_caller_method_name()}] {message}",
-        logger_name=PYCRAM_LOGGER_NAME)
+def logdebug_once(message: str, *args):
+    if _pycram_logger.isEnabledFor(logging.DEBUG):
+        rospy.logdebug_once(f"{_get_caller_prefix()} {_format_message(message, args)}", logger_name=PYCRAM_LOGGER_NAME)
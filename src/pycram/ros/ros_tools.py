@@ -1,10 +1,12 @@
 import rosgraph
 import rosnode
+import weakref
+
 import rospy
 # import rospkg
 
 from rospkg import RosPack, ResourceNotFound
-from typing_extensions import Any
+from typing_extensions import Any, List, Callable
 
 
 def get_node_names(namespace=None):
@@ -48,3 +50,37 @@ def get_time():
 
 def create_timer(duration: rospy.Duration, callback, oneshot=False):
     return rospy.Timer(duration, callback, oneshot=oneshot)
+
+
+def stop_timers_and_subscribers(timers: List[rospy.Timer], subscribers: List[rospy.Subscriber]) -> None:
+    """
+    Stops the given timers and unregisters the given subscribers. The state updaters register this with
+    :func:`weakref.finalize`, this only lets the updater be garbage collected if the callbacks of the timers and
+    subscribers do not reference it, see :func:`create_weak_callback`.
+
+    :param timers: The timers that should be shut down.
+    :param subscribers: The subscribers that should be unregistered.
+    """
+    for timer in timers:
+        timer.shutdown()
+    for subscriber in subscribers:
+        subscriber.unregister()
+
+
+def create_weak_callback(method: Callable) -> Callable:
+    """
+    Wrap a bound method into a callback for timers and subscribers that only holds a weak reference to the object of
+    the method, such that registering the callback does not keep the object alive. Once the object is garbage
+    collected the callback does nothing.
+
+    :param method: The bound method that should be called.
+    :return: The callback calling the method as long as its object is alive.
+    """
+    weak_method = weakref.WeakMethod(method)
+
+    def callback(*args, **kwargs):
+        bound_method = weak_method()
+        if bound_method is not None:
+            bound_method(*args, **kwargs)
+
+    return callback
@@ -1,16 +1,18 @@
-import atexit
+import time
+import weakref
 
 import rospy
 import tf
-import time
 
 from geometry_msgs.msg import TransformStamped
 from sensor_msgs.msg import JointState
+
 from ..datastructures.world import World
 from ..robot_description import RobotDescription
 from ..datastructures.pose import Pose
 from ..ros.data_types import Time, Duration
-from ..ros.ros_tools import wait_for_message, create_timer
+from ..ros.ros_tools import create_timer, create_weak_callback, stop_timers_and_subscribers
+from ..ros.subscriber import create_subscriber
 
 
 class RobotStateUpdater:
@@ -37,42 +39,50 @@ class RobotStateUpdater:
         time.sleep(1)
         self.tf_topic = tf_topic
         self.joint_state_topic = joint_state_topic
-        self.tf_timer = create_timer(Duration().from_sec(0.1), self._subscribe_tf)
-        self.joint_state_timer = create_timer(Duration().from_sec(0.1), self._subscribe_joint_state)
+        self.base_link: str = RobotDescription.current_robot_description.base_link
+        """
+        The base link of the robot, whose transform to the map frame is looked up on each tick of the TF timer.
+        """
+        self.tf_timer = create_timer(Duration().from_sec(0.1), create_weak_callback(self._subscribe_tf))
+        self.joint_state_subscriber = create_subscriber(self.joint_state_topic, JointState,
+                                                        create_weak_callback(self._subscribe_joint_state),
+                                                        queue_size=1)
 
-        atexit.register(self._stop_subscription)
+        self._finalizer = weakref.finalize(self, stop_timers_and_subscribers, [self.tf_timer],
+                                           [self.joint_state_subscriber])
 
     def _subscribe_tf(self, msg: TransformStamped) -> None:
         """
         Callback for the TF timer, will do a lookup of the transform between map frame and the robot base frame.
+        If the transform is not available yet the robot is not updated, the lookup is retried on the next tick.
 
         :param msg: TransformStamped message published to the topic
         """
-        self.tf_listener.waitForTransform("map", RobotDescription.current_robot_description.base_link, Time(0.0), Duration(5))
-        trans, rot = self.tf_listener.lookupTransform("map", RobotDescription.current_robot_description.base_link, Time(0.0))
+        try:
+            trans, rot = self.tf_listener.lookupTransform("map", self.base_link, Time(0.0))
+        except (tf.LookupException, tf.ConnectivityException, tf.ExtrapolationException):
+            return
         World.robot.set_pose(Pose(trans, rot))
 
     def _subscribe_joint_state(self, msg: JointState) -> None:
         """
         Sets the current joint configuration of the robot in the world to the configuration published on the
-        topic. Since this uses rospy.wait_for_message which can have errors when used with threads there might be an
-        attribute error in the rospy implementation.
+        topic. Joints in the message that the robot does not have are ignored, as are messages received before a robot
+        is loaded.
 
         :param msg: JointState message published to the topic.
         """
-        try:
-            msg = wait_for_message(self.joint_state_topic, JointState)
-            for name, position in zip(msg.name, msg.position):
-                World.robot.set_joint_position(name, position)
-        except AttributeError:
-            pass
+        robot = World.robot
+        if robot is None:
+            return
+        robot.set_multiple_joint_positions({name: position for name, position in zip(msg.name, msg.position)
+                                            if name in robot.joints})
 
     def _stop_subscription(self) -> None:
         """
-        Stops the Timer for TF and joint states and therefore the updating of the robot in the world.
+        Stops the Timer for TF and the joint state subscriber and therefore the updating of the robot in the world.
         """
-        self.tf_timer.shutdown()
-        self.joint_state_timer.shutdown()
+        self._finalizer()
 
 
 class EnvironmentStateUpdater:
@@ -98,36 +108,31 @@ class EnvironmentStateUpdater:
         self.tf_topic = tf_topic
         self.joint_state_topic = joint_state_topic
 
-        self.joint_state_timer = rospy.Timer(rospy.Duration(0.1), self._subscribe_joint_state)
+        self.joint_state_subscriber = create_subscriber(self.joint_state_topic, JointState,
+                                                        create_weak_callback(self._subscribe_joint_state),
+                                                        queue_size=1)
 
-        atexit.register(self._stop_subscription)
+        self._finalizer = weakref.finalize(self, stop_timers_and_subscribers, [], [self.joint_state_subscriber])
 
     def _subscribe_joint_state(self, msg: JointState) -> None:
         """
         Sets the current joint configuration of the environment in the world to the configuration published on the topic.
-        Since this uses rospy.wait_for_message which can have errors when used with threads there might be an attribute error
-        in the rospy implementation.
+        Each environment object in the world is set to the positions of the joints it has, the other joints in the
+        message are ignored.
 
         :param msg: JointState message published to the topic.
         """
-        try:
-            msg = rospy.wait_for_message(self.joint_state_topic, JointState)
-            for name, position in zip(msg.name, msg.position):
-                try:
-                    # Attempt to get the joint state. This might throw a KeyError if the joint name doesn't exist
-                    if World.environment.get_joint_state(name) is None:
-                        continue
-                    # Set the joint state if the joint exists
-                    World.environment.set_joint_state(name, position)
-                except KeyError:
-                    # Handle the case where the joint name does not exist
-                    pass
-        except AttributeError:
-            pass
+        joint_positions = dict(zip(msg.name, msg.position))
+        for environment in World.current_world.objects:
+            if not environment.is_an_environment:
+                continue
+            environment_joint_positions = {name: position for name, position in joint_positions.items()
+                                           if name in environment.joints}
+            if environment_joint_positions:
+                environment.set_multiple_joint_positions(environment_joint_positions)
 
     def _stop_subscription(self) -> None:
         """
-        Stops the Timer for TF and joint states and therefore the updating of the environment in the world.
+        Stops the joint state subscriber and therefore the updating of the environment in the world.
         """
-        self.joint_state_timer.shutdown()
-        self.joint_state_timer.shutdown()
+        self._finalizer()
@@ -1,8 +1,8 @@
-import atexit
+import time
+import weakref
 from datetime import timedelta
 
 import tf
-import time 
 
 from geometry_msgs.msg import TransformStamped
 from sensor_msgs.msg import JointState
@@ -12,7 +12,8 @@ from ..datastructures.world import World
 from ..robot_description import RobotDescription
 from ..datastructures.pose import Pose
 from ..ros.data_types import Time, Duration
-from ..ros.ros_tools import wait_for_message, create_timer
+from ..ros.ros_tools import create_timer, create_weak_callback, stop_timers_and_subscribers
+from ..ros.subscriber import create_subscriber
 
 
 class WorldStateUpdater:
@@ -37,11 +38,19 @@ class WorldStateUpdater:
         self.tf_topic = tf_topic
         self.joint_state_topic = joint_state_topic
         self.world: Optional[World] = world
-        self.tf_timer = create_timer(Duration().from_sec(update_rate.total_seconds()), self._subscribe_tf)
+        self.joint_state_msg: Optional[JointState] = None
+        """
+        The latest message received on the joint state topic, applied to the robot on each tick of the joint state timer.
+        """
+        self.joint_state_subscriber = create_subscriber(self.joint_state_topic, JointState,
+                                                        create_weak_callback(self._receive_joint_state), queue_size=1)
+        self.tf_timer = create_timer(Duration().from_sec(update_rate.total_seconds()),
+                                     create_weak_callback(self._subscribe_tf))
         self.joint_state_timer = create_timer(Duration().from_sec(update_rate.total_seconds()),
-                                              self._subscribe_joint_state)
+                                              create_weak_callback(self._subscribe_joint_state))
 
-        atexit.register(self._stop_subscription)
+        self._finalizer = weakref.finalize(self, stop_timers_and_subscribers, [self.tf_timer, self.joint_state_timer],
+                                           [self.joint_state_subscriber])
 
     def _subscribe_tf(self, msg: TransformStamped) -> None:
         """
@@ -64,25 +73,34 @@ class WorldStateUpdater:
             trans, rot = self.tf_listener.lookupTransform("/map", tf_frame, Time(0))
             obj.set_pose(Pose(trans, rot))
 
+    def _receive_joint_state(self, msg: JointState) -> None:
+        """
+        Callback for the joint state subscriber, keeps the latest message to be applied by the joint state timer.
+
+        :param msg: JointState message published to the topic.
+        """
+        self.joint_state_msg = msg
+
     def _subscribe_joint_state(self, msg: JointState) -> None:
         """
-        Sets the current joint configuration of the robot in the world to the configuration published on the
-        topic. Since this uses rospy.wait_for_message which can have errors when used with threads there might be an
-        attribute error in the rospy implementation.
+        Sets the current joint configuration of the robot in the world to the latest configuration published on the
+        topic, if one was received yet and a robot is loaded. Joints in the message that the robot does not have are
+        ignored.
 
         :param msg: JointState message published to the topic.
         """
-        try:
-            msg = wait_for_message(self.joint_state_topic, JointState)
-            joint_positions = dict(zip(msg.name, msg.position))
-            World.robot.set_multiple_joint_positions(joint_positions)
-        except AttributeError:
-            pass
+        joint_state_msg = self.joint_state_msg
+        robot = World.robot
+        if joint_state_msg is None or robot is None:
+            return
+        robot.set_multiple_joint_positions({name: position
+                                            for name, position in zip(joint_state_msg.name, joint_state_msg.position)
+                                            if name in robot.joints})
 
     def _stop_subscription(self) -> None:
         """
-        Stops the Timer for TF and joint states and therefore the updating of the robot in the world.
+        Stops the timers for TF and joint states and the joint state subscriber and therefore the updating of the robot
+        in the world.
         """
-        self.tf_timer.shutdown()
-        self.joint_state_timer.shutdown()
+        self._finalizer()
 
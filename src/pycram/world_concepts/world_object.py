@@ -9,8 +9,7 @@ import numpy as np
 import owlready2
 from deprecated import deprecated
 from geometry_msgs.msg import Point, Quaternion
-from trimesh.parent import Geometry3D
-from typing_extensions import Type, Optional, Dict, Tuple, List, Union
+from typing_extensions import Type, Optional, Dict, Tuple, List, Union, TYPE_CHECKING
 
 from ..datastructures.dataclasses import (Color, ObjectState, LinkState, JointState,
                                           AxisAlignedBoundingBox, VisualShape, ClosestPointsList,
@@ -40,6 +39,9 @@ from pycrap.ontologies import PhysicalObject, ontology, Base, Agent, Joint, \
 
 from pycrap.urdf_parser import parse_furniture, parse_joint_types
 
+if TYPE_CHECKING:
+    from trimesh.parent import Geometry3D
+
 Link = ObjectDescription.Link
 
 
@@ -208,7 +210,7 @@ class Object(PhysicalBody):
         extension = Path(path).suffix
         if extension in self.extension_to_description_type:
             self.description = self.extension_to_description_type[extension]()
-        elif extension in ObjectDescription.mesh_extensions:
+        elif extension.lower() in ObjectDescription.mesh_extensions:
             self.description = self.world.conf.default_description_type()
         else:
             raise UnsupportedFileExtension(self.name, path)
@@ -339,6 +341,8 @@ class Object(PhysicalBody):
         Set the name of the object.
         """
         self._name = name
+        for link in getattr(self, "links", {}).values():
+            link.reset_tf_frame_cache()
         if name in [obj.name for obj in self.world.objects]:
             raise ObjectAlreadyExists(self)
 
@@ -445,10 +449,11 @@ class Object(PhysicalBody):
         """
         self.links = {}
         ontology_concept = PhysicalObject
+        root_link_name = self.description.get_root()
         for link_name, link_id in self.link_name_to_id.items():
             link_description = self.description.get_link_by_name(link_name)
-            if link_name == self.description.get_root():
-                self.links[link_name] = self.description.RootLink(self)
+            if link_name == root_link_name:
+                self.links[link_name] = self.description.RootLink(self, link_description)
             else:
                 self.links[link_name] = self.description.Link(link_id, link_description, self)
 
@@ -21,17 +21,16 @@ def stable(obj: Object) -> bool:
     :param obj: The object which should be checked
     :return: True if the given object is stable in the world False else
     """
-    prospection_obj = World.current_world.get_prospection_object_for_object(obj)
     with UseProspectionWorld():
+        world = World.current_world
+        prospection_obj = world.get_prospection_object_for_object(obj)
         coords_prev = prospection_obj.get_position_as_list()
-        World.current_world.set_gravity([0, 0, -9.8])
+        world.set_gravity([0, 0, -9.8])
 
-        World.current_world.simulate(2)
+        world.simulate(2)
         coords_past = prospection_obj.get_position_as_list()
 
-        coords_prev = list(map(lambda n: round(n, 3), coords_prev))
-        coords_past = list(map(lambda n: round(n, 3), coords_past))
-        return coords_past == coords_prev
+        return bool(np.allclose(coords_prev, coords_past, rtol=0, atol=5e-4))
 
 
 def contact(
@@ -50,11 +49,12 @@ def contact(
     """
 
     with UseProspectionWorld():
-        prospection_obj1 = World.current_world.get_prospection_object_for_object(object1)
-        prospection_obj2 = World.current_world.get_prospection_object_for_object(object2)
-        World.current_world.perform_collision_detection()
-        con_points: ContactPointsList = World.current_world.get_contact_points_between_two_bodies(prospection_obj1,
-                                                                                                  prospection_obj2)
+        world = World.current_world
+        prospection_obj1 = world.get_prospection_object_for_object(object1)
+        prospection_obj2 = world.get_prospection_object_for_object(object2)
+        world.perform_collision_detection()
+        con_points: ContactPointsList = world.get_contact_points_between_two_bodies(prospection_obj1,
+                                                                                    prospection_obj2)
         objects_are_in_contact = len(con_points) > 0
         if return_links:
             contact_links = [(point.body_a, point.body_b) for point in con_points]
@@ -78,12 +78,14 @@ def prospect_robot_contact(robot: Object, pose: Pose,
         prospection_robot.set_pose(pose)
         floor = prospection_robot.world.get_object_by_name("floor")
         ignore_collision_with = [] if ignore_collision_with is None else ignore_collision_with
-        ignore = [o.name for o in ignore_collision_with]
+        skip_names = {prospection_robot.name, floor.name, *(o.name for o in ignore_collision_with)}
+        robot_contact_points = prospection_robot.world.get_body_contact_points(prospection_robot)
         for obj in prospection_robot.world.objects:
-            if obj.name in ([prospection_robot.name, floor.name] + ignore):
+            if obj.name in skip_names:
                 continue
-            in_contact, contact_links = contact(prospection_robot, obj, return_links=True)
-            if in_contact and not is_held_object(prospection_robot, obj, [links[0] for links in contact_links]):
+            obj_contact_points = robot_contact_points.get_points_of_object(obj)
+            if (len(obj_contact_points) > 0
+                    and not is_held_object(prospection_robot, obj, [point.body_a for point in obj_contact_points])):
                 logdebug(f"Robot is in contact with {obj.name} in prospection: {obj.world.is_prospection_world}"
                          f"at position {pose.position_as_list()} and z_angle {pose.z_angle}")
                 return True
@@ -101,16 +103,13 @@ def is_held_object(robot: Object, obj: Object, robot_contact_links: List[Link])
     :param robot_contact_links: The links of the robot that are in contact with the object
     :return: True if the object is picked by the robot, False otherwise
     """
-    picked_object = False
     if obj in robot.attachments:
-        arm_chains = RobotDescription.current_robot_description.get_manipulator_chains()
-        for chain in arm_chains:
-            gripper_links = chain.end_effector.links
-            if (robot.attachments[obj].parent_link.name in gripper_links
+        parent_link_name = robot.attachments[obj].parent_link.name
+        for gripper_links in RobotDescription.current_robot_description.get_gripper_link_sets():
+            if (parent_link_name in gripper_links
                     and all(link.name in gripper_links for link in robot_contact_links)):
-                picked_object = True
-                continue
-    return picked_object
+                return True
+    return False
 
 
 def get_visible_objects(
@@ -125,22 +124,75 @@ def get_visible_objects(
     :param plot_segmentation_mask: If the segmentation mask should be plotted
     :return: A segmentation mask of the objects that are visible and the pose of the point at exactly 2 meters in front of the camera in the direction of the front facing axis with respect to the world coordinate frame.
     """
+    target_point = get_camera_target_point(camera_pose, front_facing_axis)
+
+    seg_mask = World.current_world.get_images_for_target(target_point, camera_pose)[2]
+
+    if plot_segmentation_mask:
+        RayTestUtils.plot_segmentation_mask(seg_mask)
+
+    return seg_mask, target_point
+
+
+def get_camera_target_point(camera_pose: Pose, front_facing_axis: Optional[List[float]] = None) -> Pose:
+    """
+    Return the point at exactly 2 meters in front of the camera in the direction of the front facing axis, this is the
+    point the camera looks at when rendering images.
+
+    :param camera_pose: The pose of the camera in world coordinate frame.
+    :param front_facing_axis: The axis, of the camera frame, which faces to the front of the robot. Given as list of xyz
+    :return: The pose of the target point with respect to the world coordinate frame.
+    """
     if front_facing_axis is None:
         front_facing_axis = RobotDescription.current_robot_description.get_default_camera().front_facing_axis
 
     camera_frame = RobotDescription.current_robot_description.get_camera_frame(World.robot.name)
     world_to_cam = camera_pose.to_transform(camera_frame)
 
-    cam_to_point = Transform(list(np.multiply(front_facing_axis, 2)), [0, 0, 0, 1], camera_frame,
+    cam_to_point = Transform([axis_value * 2.0 for axis_value in front_facing_axis], [0, 0, 0, 1], camera_frame,
                              "point")
-    target_point = (world_to_cam * cam_to_point).to_pose()
+    return (world_to_cam * cam_to_point).to_pose()
 
-    seg_mask = World.current_world.get_images_for_target(target_point, camera_pose)[2]
 
-    if plot_segmentation_mask:
-        RayTestUtils.plot_segmentation_mask(seg_mask)
+def _is_behind_camera(obj: Object, camera_pose: Pose, target_point: Pose) -> bool:
+    """
+    Check if the object is completely behind the camera, meaning that every corner of its axis aligned bounding box lies
+    behind the plane through the camera that is orthogonal to the viewing direction. Such an object can not be seen
+    from the camera, independent of the field of view of the renderer.
+
+    :param obj: The object that should be checked
+    :param camera_pose: The pose of the camera in world coordinate frame
+    :param target_point: The point the camera looks at, as returned by :func:`get_camera_target_point`
+    :return: True if the object is completely behind the camera, False otherwise
+    """
+    camera_position = np.array(camera_pose.position_as_list())
+    viewing_direction = np.array(target_point.position_as_list()) - camera_position
+    box_min, box_max = obj.get_axis_aligned_bounding_box().get_min_max()
+    # The corner of the box that is furthest along the viewing direction, one extremum per axis
+    furthest_corner_projection = np.maximum(viewing_direction * box_min, viewing_direction * box_max).sum()
+    return furthest_corner_projection < viewing_direction @ camera_position
 
-    return seg_mask, target_point
+
+_hidden_pose: Optional[Pose] = None
+"""
+The pose far away from the scene to which objects are moved to hide them, shared by all calls of
+:func:`_move_objects_out_of_view`. It is created on first use since creating a Pose reads the ROS time.
+"""
+
+
+def _move_objects_out_of_view(objects: List[Object]) -> None:
+    """
+    Move the given objects far away from the scene in the current world, such that they are not rendered. All objects
+    are moved with a single call to the world, the attachments of the objects are not updated.
+
+    :param objects: The objects that should be moved out of view
+    """
+    global _hidden_pose
+    if not objects:
+        return
+    if _hidden_pose is None:
+        _hidden_pose = Pose([100, 100, 0], [0, 0, 0, 1])
+    World.current_world.reset_multiple_objects_base_poses({obj: _hidden_pose for obj in objects})
 
 
 def visible(
@@ -162,32 +214,91 @@ def visible(
     :return: True if the object is visible from the camera_position False if not
     """
     with UseProspectionWorld():
-        prospection_obj = World.current_world.get_prospection_object_for_object(obj)
+        world = World.current_world
+        prospection_obj = world.get_prospection_object_for_object(obj)
+        target_point = get_camera_target_point(camera_pose, front_facing_axis)
+        if _is_behind_camera(prospection_obj, camera_pose, target_point):
+            return False
         if World.robot:
-            prospection_robot = World.current_world.get_prospection_object_for_object(World.robot)
+            prospection_robot = world.get_prospection_object_for_object(World.robot)
 
-        state_id = World.current_world.save_state()
-        for obj in World.current_world.objects:
-            if obj == prospection_obj or (World.robot and obj == prospection_robot):
-                continue
-            else:
-                obj.set_pose(Pose([100, 100, 0], [0, 0, 0, 1]), set_attachments=False)
+        state_id = world.save_state()
+        _move_objects_out_of_view([other_obj for other_obj in world.objects
+                                   if not (other_obj == prospection_obj
+                                           or (World.robot and other_obj == prospection_robot))])
 
-        seg_mask, target_point = get_visible_objects(camera_pose, front_facing_axis, plot_segmentation_mask)
-        max_pixel = np.array(seg_mask == prospection_obj.id).sum()
+        seg_mask = world.get_images_for_target(target_point, camera_pose)[2]
+        if plot_segmentation_mask:
+            RayTestUtils.plot_segmentation_mask(seg_mask)
+        max_pixel = np.count_nonzero(seg_mask == prospection_obj.id)
 
-        World.current_world.restore_state(state_id)
+        world.restore_state(state_id)
 
         if max_pixel == 0:
             # Object is not visible
             return False
 
-        seg_mask = World.current_world.get_images_for_target(target_point, camera_pose)[2]
-        real_pixel = np.array(seg_mask == prospection_obj.id).sum()
+        seg_mask = world.get_images_for_target(target_point, camera_pose)[2]
+        real_pixel = np.count_nonzero(seg_mask == prospection_obj.id)
 
         return real_pixel / max_pixel > threshold > 0
 
 
+def visible_objects(
+        objects: List[Object],
+        camera_pose: Pose,
+        front_facing_axis: Optional[List[float]] = None,
+        threshold: float = 0.8) -> List[Object]:
+    """
+    Get the objects that are visible from a given position, the visibility of each object is checked like in
+    :func:`visible`. The complete scene is rendered only once for all objects, and the other objects are moved out of
+    the way only once instead of once per object.
+
+    :param objects: The objects for which the visibility should be checked
+    :param camera_pose: The pose of the camera in map frame
+    :param front_facing_axis: The axis, of the camera frame, which faces to the front of the robot. Given as list of xyz
+    :param threshold: The minimum percentage of an object that needs to be visible for it to count as visible.
+    :return: The visible objects in the order in which they were given.
+    """
+    if not objects:
+        return []
+    with UseProspectionWorld():
+        world = World.current_world
+        prospection_objects = [world.get_prospection_object_for_object(obj) for obj in objects]
+        prospection_robot = world.get_prospection_object_for_object(World.robot) if World.robot \
+            else None
+
+        scene_seg_mask, target_point = get_visible_objects(camera_pose, front_facing_axis)
+
+        # Objects behind the camera can not be visible, so they are not rendered on their own
+        candidates = [(obj, prospection_obj) for obj, prospection_obj in zip(objects, prospection_objects)
+                      if not _is_behind_camera(prospection_obj, camera_pose, target_point)]
+        if not candidates:
+            return []
+
+        state_id = world.save_state()
+        poses = {prospection_obj: prospection_obj.get_pose() for _, prospection_obj in candidates}
+        _move_objects_out_of_view([obj for obj in world.objects if obj != prospection_robot])
+
+        visible_objs = []
+        for obj, prospection_obj in candidates:
+            prospection_obj.set_pose(poses[prospection_obj], set_attachments=False)
+            seg_mask = world.get_images_for_target(target_point, camera_pose)[2]
+            _move_objects_out_of_view([prospection_obj])
+
+            max_pixel = np.count_nonzero(seg_mask == prospection_obj.id)
+            if max_pixel == 0:
+                # Object is not visible
+                continue
+            real_pixel = np.count_nonzero(scene_seg_mask == prospection_obj.id)
+            if real_pixel / max_pixel > threshold > 0:
+                visible_objs.append(obj)
+
+        world.restore_state(state_id)
+
+    return visible_objs
+
+
 def occluding(
         obj: Object,
         camera_pose: Pose,
@@ -207,31 +318,27 @@ def occluding(
     """
 
     with UseProspectionWorld():
-        state_id = World.current_world.save_state()
-        for other_obj in World.current_world.objects:
-            if other_obj.name == World.current_world.robot.name:
-                continue
-            elif obj.get_pose() == other_obj.get_pose():
-                obj = other_obj
-            else:
-                other_obj.set_pose(Pose([100, 100, 0], [0, 0, 0, 1]))
+        world = World.current_world
+        prospection_obj = world.get_prospection_object_for_object(obj)
+        state_id = world.save_state()
+        robot_name = world.robot.name
+        _move_objects_out_of_view([other_obj for other_obj in world.objects
+                                   if other_obj != prospection_obj and other_obj.name != robot_name])
 
         seg_mask, target_point = get_visible_objects(camera_pose, front_facing_axis, plot_segmentation_mask)
 
-        # All indices where the object that could be occluded is in the image
-        # [0] at the end is to reduce by one dimension because dstack adds an unnecessary dimension
-        pix = np.dstack(np.nonzero(seg_mask == obj.id))[0]
+        # Mask of the pixels where the object that could be occluded is in the image
+        obj_pixels = seg_mask == prospection_obj.id
 
-        World.current_world.restore_state(state_id)
+        world.restore_state(state_id)
 
-        occluding_obj_ids = []
-        seg_mask = World.current_world.get_images_for_target(target_point, camera_pose)[2]
-        for c in pix:
-            if not seg_mask[c[0]][c[1]] == obj.id:
-                occluding_obj_ids.append(seg_mask[c[0]][c[1]])
+        seg_mask = world.get_images_for_target(target_point, camera_pose)[2]
+        # The ids of everything that is seen in the complete scene at the pixels of the object, except the object
+        ids_at_obj_pixels = np.unique(seg_mask[obj_pixels])
+        occluding_obj_ids = ids_at_obj_pixels[ids_at_obj_pixels != prospection_obj.id].tolist()
 
-        occ_objects = list(set(map(World.current_world.get_object_by_id, occluding_obj_ids)))
-        occ_objects = list(map(World.current_world.get_object_for_prospection_object, occ_objects))
+        occ_objects = list(map(world.get_object_by_id, occluding_obj_ids))
+        occ_objects = list(map(world.get_object_for_prospection_object, occ_objects))
 
         return occ_objects
 
@@ -253,8 +360,8 @@ def reachable(
     :return: True if the end effector is closer than the threshold to the target position, False in every other case
     """
 
-    prospection_robot = World.current_world.get_prospection_object_for_object(robot)
     with UseProspectionWorld():
+        prospection_robot = World.current_world.get_prospection_object_for_object(robot)
         target_pose = try_to_reach(pose_or_object, prospection_robot, gripper_name)
 
         if not target_pose:
@@ -285,14 +392,16 @@ def blocking(
     """
 
     with UseProspectionWorld():
-        prospection_robot = World.current_world.get_prospection_object_for_object(robot)
+        world = World.current_world
+        prospection_robot = world.get_prospection_object_for_object(robot)
         if grasp:
             try_to_reach_with_grasp(pose_or_object, prospection_robot, gripper_name, grasp)
         else:
             try_to_reach(pose_or_object, prospection_robot, gripper_name)
 
-        block = [World.current_world.get_object_for_prospection_object(obj) for obj in World.current_world.objects
-                 if contact(prospection_robot, obj)]
+        robot_contact_points = world.get_body_contact_points(prospection_robot)
+        block = [world.get_object_for_prospection_object(obj) for obj in world.objects
+                 if len(robot_contact_points.get_points_of_object(obj)) > 0]
     return block
 
 
@@ -307,7 +416,7 @@ def supporting(
     :param object2: Object that supports the first object
     :return: True if the second object is in contact with the first one and the second is above the first else False
     """
-    return contact(object1, object2) and object2.get_position().z > object1.get_position().z
+    return object2.get_position().z > object1.get_position().z and contact(object1, object2)
 
 
 def link_pose_for_joint_config(
@@ -324,8 +433,8 @@ def link_pose_for_joint_config(
     :param link_name: Name of the link for which the pose should be returned
     :return: The pose of the link after applying the joint configuration
     """
-    prospection_object = World.current_world.get_prospection_object_for_object(obj)
     with UseProspectionWorld():
+        prospection_object = World.current_world.get_prospection_object_for_object(obj)
         for joint, pose in joint_config.items():
             prospection_object.set_joint_position(joint, pose)
         return prospection_object.get_link_pose(link_name)
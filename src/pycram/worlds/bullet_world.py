@@ -8,7 +8,7 @@ import time
 import numpy as np
 import pycram_bullet as p
 from geometry_msgs.msg import Point
-from typing_extensions import List, Optional, Dict, Any, Callable
+from typing_extensions import List, Optional, Dict, Any, Callable, Tuple
 
 from pycrap.ontologies import Floor
 from ..datastructures.dataclasses import Color, AxisAlignedBoundingBox, MultiBody, VisualShape, BoxVisualShape, \
@@ -247,8 +247,13 @@ class BulletWorld(World):
 
     @validate_multiple_joint_positions
     def _set_multiple_joint_positions(self, joint_positions: Dict[Joint, float]) -> bool:
+        joints_per_object: Dict[int, Tuple[List[int], List[List[float]]]] = {}
         for joint, joint_position in joint_positions.items():
-            self.reset_joint_position(joint, joint_position)
+            joint_ids, positions = joints_per_object.setdefault(joint.object_id, ([], []))
+            joint_ids.append(joint.id)
+            positions.append([joint_position])
+        for object_id, (joint_ids, positions) in joints_per_object.items():
+            p.resetJointStatesMultiDof(object_id, joint_ids, positions, physicsClientId=self.id)
         return True
 
     @validate_joint_position
@@ -257,7 +262,16 @@ class BulletWorld(World):
         return True
 
     def _get_multiple_joint_positions(self, joints: List[Joint]) -> Dict[str, float]:
-        return {joint.name: self.get_joint_position(joint) for joint in joints}
+        joints_per_object: Dict[int, List[Joint]] = {}
+        for joint in joints:
+            joints_per_object.setdefault(joint.object_id, []).append(joint)
+        joint_positions = {}
+        for object_id, object_joints in joints_per_object.items():
+            joint_states = p.getJointStates(object_id, [joint.id for joint in object_joints],
+                                            physicsClientId=self.id)
+            joint_positions.update({joint.name: joint_state[0]
+                                    for joint, joint_state in zip(object_joints, joint_states)})
+        return joint_positions
 
     @validate_multiple_object_poses
     def reset_multiple_objects_base_poses(self, objects: Dict[Object, Pose]) -> bool:
@@ -95,8 +95,8 @@ class MultiverseReader(MultiverseClient):
                                             },
                                            wait=wait)
         if data is not None:
-            return {name: Pose(data[name][BodyProperty.POSITION.value],
-                               wxyz_to_xyzw(data[name][BodyProperty.ORIENTATION.value]))
+            position_key, orientation_key = BodyProperty.POSITION.value, BodyProperty.ORIENTATION.value
+            return {name: Pose(data[name][position_key], wxyz_to_xyzw(data[name][orientation_key]))
                     for name in body_names}
 
     def get_body_position(self, name: str, wait: bool = False) -> Optional[List[float]]:
@@ -141,7 +141,8 @@ class MultiverseReader(MultiverseClient):
         """
         data = self.get_multiple_body_properties(body_names, [BodyProperty.ORIENTATION], wait=wait)
         if data is not None:
-            return {name: wxyz_to_xyzw(data[name][BodyProperty.ORIENTATION.value]) for name in body_names}
+            orientation_key = BodyProperty.ORIENTATION.value
+            return {name: wxyz_to_xyzw(data[name][orientation_key]) for name in body_names}
 
     def get_body_property(self, name: str, property_: Property, wait: bool = False) -> Optional[List[float]]:
         """
@@ -278,8 +279,11 @@ class MultiverseReader(MultiverseClient):
         if properties is None:
             return name in data
         else:
-            return name in data and all([prop.value in data[name] and None not in data[name][prop.value]
-                                         for prop in properties])
+            if name not in data:
+                return False
+            body_data = data[name]
+            property_keys = [prop.value for prop in properties]
+            return all([key in body_data and None not in body_data[key] for key in property_keys])
 
     def get_received_data(self):
         """
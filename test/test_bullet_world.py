@@ -56,6 +56,11 @@ class BulletWorldTest(BulletWorldTestCase):
         self.assertTrue(milk_id not in [obj.id for obj in self.world.objects])
         BulletWorldTest.milk = Object("milk", Milk, "milk.stl", pose=Pose([1.3, 1, 0.9]))
 
+    def test_get_objects_by_types(self):
+        self.assertEqual(self.world.get_object_by_type(Milk), [self.milk])
+        objects = self.world.get_objects_by_types([Milk, Robot])
+        self.assertEqual(set(objects), {self.milk, self.robot})
+
     def test_remove_robot(self):
         robot_id = self.robot.id
         self.assertTrue(robot_id in [obj.id for obj in self.world.objects])
@@ -23,6 +23,25 @@ class TestCaseBulletWorldReasoning(BulletWorldTestCase):
         self.assertTrue(btr.visible(self.milk, self.robot.get_link_pose(camera_link),
                                     RobotDescription.current_robot_description.get_default_camera().front_facing_axis))
 
+    def test_visible_behind_camera(self):
+        self.milk.set_pose(Pose([-1.5, 0, 1.2]))
+        self.robot.set_pose(Pose())
+        time.sleep(1)
+        camera_link = RobotDescription.current_robot_description.get_camera_link()
+        self.assertFalse(btr.visible(self.milk, self.robot.get_link_pose(camera_link),
+                                     RobotDescription.current_robot_description.get_default_camera().front_facing_axis))
+
+    def test_visible_objects(self):
+        self.milk.set_pose(Pose([1.5, 0, 1.2]))
+        self.cereal.set_pose(Pose([-1.5, 0, 1.2]))
+        self.robot.set_pose(Pose())
+        time.sleep(1)
+        camera_link = RobotDescription.current_robot_description.get_camera_link()
+        visible_objects = btr.visible_objects([self.milk, self.cereal], self.robot.get_link_pose(camera_link),
+                                              RobotDescription.current_robot_description.get_default_camera().front_facing_axis)
+        self.assertEqual(visible_objects, [self.milk])
+        self.assertEqual(self.cereal.get_pose().position_as_list(), [-1.5, 0, 1.2])
+
     def test_occluding(self):
         self.milk.set_pose(Pose([3, 0, 1.2]))
         self.robot.set_pose(Pose())
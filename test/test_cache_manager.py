@@ -1,6 +1,11 @@
 import os
+import shutil
+import tempfile
+import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from pycram.cache_manager import CacheManager
 from pycram.testing import BulletWorldTestCase
 from pycram.object_descriptors.urdf import ObjectDescription as URDFObject
 from pycram.config import world_conf as conf
@@ -16,3 +21,51 @@ class TestCacheManager(BulletWorldTestCase):
         apartment = URDFObject(path)
         apartment.generate_description_from_file(path, "apartment", extension, cache_path)
         self.assertTrue(cache_manager.is_cached(path, apartment))
+
+
+class TestCacheManagerFileIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.other_data_dir = tempfile.mkdtemp()
+        self.cache_manager = CacheManager(os.path.join(self.data_dir, "cache"), [self.data_dir], clear_cache=False)
+        self.file_path = self.create_file(self.data_dir, "milk.stl")
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+        shutil.rmtree(self.other_data_dir)
+
+    @staticmethod
+    def create_file(directory: str, name: str) -> str:
+        path = os.path.join(directory, name)
+        Path(path).touch()
+        return path
+
+    def test_index_is_reused(self):
+        with patch.object(CacheManager, "index_data_directories",
+                          wraps=self.cache_manager.index_data_directories) as index_data_directories:
+            self.assertEqual(self.cache_manager.look_for_file_in_data_dir(Path("milk.stl")), self.file_path)
+            self.assertEqual(self.cache_manager.look_for_file_in_data_dir(Path("milk.stl")), self.file_path)
+            self.assertEqual(index_data_directories.call_count, 1)
+
+    def test_finds_file_added_after_indexing(self):
+        self.cache_manager.look_for_file_in_data_dir(Path("milk.stl"))
+        new_file_path = self.create_file(self.data_dir, "bowl.stl")
+        self.assertEqual(self.cache_manager.look_for_file_in_data_dir(Path("bowl.stl")), new_file_path)
+
+    def test_finds_file_moved_after_indexing(self):
+        self.cache_manager.look_for_file_in_data_dir(Path("milk.stl"))
+        os.makedirs(os.path.join(self.data_dir, "objects"))
+        moved_file_path = os.path.join(self.data_dir, "objects", "milk.stl")
+        shutil.move(self.file_path, moved_file_path)
+        self.assertEqual(self.cache_manager.look_for_file_in_data_dir(Path("milk.stl")), moved_file_path)
+
+    def test_finds_file_in_added_data_directory(self):
+        self.cache_manager.look_for_file_in_data_dir(Path("milk.stl"))
+        new_file_path = self.create_file(self.other_data_dir, "bowl.stl")
+        self.cache_manager.data_directories.append(self.other_data_dir)
+        self.assertEqual(self.cache_manager.look_for_file_in_data_dir(Path("bowl.stl")), new_file_path)
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            self.cache_manager.look_for_file_in_data_dir(Path("not_existing.stl"))
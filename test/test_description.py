@@ -1,6 +1,10 @@
 import os.path
 import pathlib
+import shutil
+import tempfile
+import unittest
 
+from pycram.description import load_mesh, get_mesh_convex_hull
 from pycram.testing import BulletWorldTestCase
 
 
@@ -36,3 +40,39 @@ class DescriptionTest(BulletWorldTestCase):
         cache_path = os.path.join(cache_path, f"{self.robot.description.name}.urdf")
         self.robot.description.generate_from_description_file(pr2_path, cache_path)
         self.assertTrue(self.world.cache_manager.is_cached(self.robot.name, self.robot.description))
+
+
+class MeshCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        milk_path = pathlib.Path(__file__).parent.resolve() / "../resources/objects/milk.stl"
+        self.mesh_path = os.path.join(self.tmp_dir, "milk.stl")
+        shutil.copyfile(milk_path, self.mesh_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def touch_mesh(self):
+        stat = os.stat(self.mesh_path)
+        os.utime(self.mesh_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_load_mesh_is_cached(self):
+        self.assertIs(load_mesh(self.mesh_path), load_mesh(self.mesh_path))
+
+    def test_load_mesh_reloads_modified_file(self):
+        mesh = load_mesh(self.mesh_path)
+        self.touch_mesh()
+        reloaded_mesh = load_mesh(self.mesh_path)
+        self.assertIsNot(mesh, reloaded_mesh)
+        self.assertIs(reloaded_mesh, load_mesh(self.mesh_path))
+
+    def test_convex_hull_is_cached(self):
+        hull = get_mesh_convex_hull(self.mesh_path)
+        self.assertIs(hull, get_mesh_convex_hull(self.mesh_path))
+        self.assertTrue(hull.is_convex)
+
+    def test_convex_hull_is_recomputed_for_modified_file(self):
+        hull = get_mesh_convex_hull(self.mesh_path)
+        self.touch_mesh()
+        self.assertIsNot(hull, get_mesh_convex_hull(self.mesh_path))
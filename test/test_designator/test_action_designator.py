@@ -95,6 +95,19 @@ class TestActionDesignatorGrounding(BulletWorldTestCase):
             description.resolve().perform()
         # TODO: Needs a way to test the approximate looking direction of the robot
 
+    def test_look_at_points_head_at_target(self):
+        # The target is neither 1 m away horizontally nor at the height of the head
+        target = Pose([2.5, 0.5, 0.3])
+        with simulated_robot:
+            action_designator.LookAtAction([target]).resolve().perform()
+        tilt_link_matrix = self.robot.get_link_pose("head_tilt_link").get_homogeneous_matrix()
+        target_in_tilt_link = tilt_link_matrix[:3, :3].T @ (np.array(target.position_as_list()) -
+                                                            tilt_link_matrix[:3, 3])
+        pan_error = np.arctan2(target_in_tilt_link[1], target_in_tilt_link[0])
+        tilt_error = np.arctan2(target_in_tilt_link[2], np.hypot(target_in_tilt_link[0], target_in_tilt_link[1]))
+        self.assertAlmostEqual(pan_error, 0, delta=0.05)
+        self.assertAlmostEqual(tilt_error, 0, delta=0.05)
+
     def test_detect(self):
         self.kitchen.set_pose(Pose([10, 10, 0]))
         self.milk.set_pose(Pose([1.5, 0, 1.2]))
@@ -1,3 +1,6 @@
+import unittest
+from unittest.mock import patch
+
 from pycram.testing import BulletWorldTestCase
 from pycram.ros.logging import set_logger_level, logwarn, logerr, logdebug
 from pycram.datastructures.enums import LoggerLevel
@@ -15,3 +18,36 @@ class TestLogging(BulletWorldTestCase):
         logdebug("This is a debug message, it should not be printed")
         logwarn("This is a warning, it should not be printed")
         logerr("This is an error, it should be printed")
+
+
+class StrCounter:
+    """Counts how often it is converted to a string."""
+
+    def __init__(self):
+        self.str_calls = 0
+
+    def __str__(self):
+        self.str_calls += 1
+        return "counter"
+
+
+@patch('pycram.ros.logging.rospy')
+@patch('pycram.ros.logging._pycram_logger')
+class TestLazyLogFormatting(unittest.TestCase):
+
+    def test_arguments_are_not_formatted_for_disabled_level(self, mock_logger, mock_rospy):
+        mock_logger.isEnabledFor.return_value = False
+        argument = StrCounter()
+        logdebug("Value: %s", argument)
+        self.assertEqual(argument.str_calls, 0)
+        mock_rospy.logdebug.assert_not_called()
+
+    def test_arguments_are_formatted_for_enabled_level(self, mock_logger, mock_rospy):
+        mock_logger.isEnabledFor.return_value = True
+        logdebug("Value: %s", StrCounter())
+        self.assertTrue(mock_rospy.logdebug.call_args.args[0].endswith(" Value: counter"))
+
+    def test_message_without_arguments_is_not_formatted(self, mock_logger, mock_rospy):
+        mock_logger.isEnabledFor.return_value = True
+        logwarn("100% done")
+        self.assertTrue(mock_rospy.logwarn.call_args.args[0].endswith(" 100% done"))
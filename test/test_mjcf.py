@@ -38,3 +38,9 @@ class TestMjcf(TestCase):
         self.assertEqual(self.model.get_chain('body1', 'body3'),
                          ['body1', 'joint1', 'body2', 'joint2', 'body3'])
 
+    def test_get_chain_returns_a_copy_of_the_cached_chain(self):
+        chain = self.model.get_chain('body1', 'body3')
+        chain.append('body4')
+        self.assertEqual(self.model.get_chain('body1', 'body3'),
+                         ['body1', 'joint1', 'body2', 'joint2', 'body3'])
+
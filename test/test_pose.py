@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from pycram.datastructures.pose import Pose, Transform
 
 
@@ -44,6 +46,14 @@ class TestPose(unittest.TestCase):
         self.assertEqual(p1, p2)
         self.assertFalse(p1 is p2)
 
+    def test_pose_homogeneous_matrix(self):
+        p = Pose([1, 2, 3], [0, 0, 1, 0], "map")
+
+        matrix = p.get_homogeneous_matrix()
+        self.assertEqual(matrix[:3, 3].tolist(), [1, 2, 3])
+        self.assertTrue(np.allclose(matrix, p.to_transform("test_frame").get_homogeneous_matrix()))
+        self.assertTrue(Pose.from_homogeneous_matrix(matrix, "map").almost_equal(p))
+
     def test_transform_creation(self):
         t = Transform([1, 2, 3], [0, 0, 0, 1], "map", "test_frame")
 
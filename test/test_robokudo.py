@@ -0,0 +1,78 @@
+import importlib
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+
+import pycram.external_interfaces
+from pycram.external_interfaces import robokudo
+
+
+class RobokudoImportTestCase(unittest.TestCase):
+
+    def test_import_without_robokudo_msgs(self):
+        self.addCleanup(setattr, pycram.external_interfaces, 'robokudo', robokudo)
+        with patch.dict(sys.modules, {'robokudo_msgs': None, 'robokudo_msgs.msg': None}):
+            sys.modules.pop('pycram.external_interfaces.robokudo')
+            module = importlib.import_module('pycram.external_interfaces.robokudo')
+            self.assertFalse(module.robokudo_found)
+
+
+class RobokudoNodeCheckTestCase(unittest.TestCase):
+
+    def setUp(self):
+        robokudo._robokudo_node_check_time = None
+        robokudo._robokudo_node_running = False
+
+    def tearDown(self):
+        robokudo._robokudo_node_check_time = None
+        robokudo._robokudo_node_running = False
+
+    @patch('pycram.external_interfaces.robokudo.time.monotonic')
+    @patch('pycram.external_interfaces.robokudo.get_node_names')
+    def test_node_check_is_reused_within_interval(self, mock_get_node_names, mock_monotonic):
+        mock_get_node_names.return_value = ['/robokudo']
+        mock_monotonic.side_effect = [100.0, 100.0 + robokudo.ROBOKUDO_NODE_CHECK_INTERVAL / 2]
+        self.assertTrue(robokudo.is_robokudo_running())
+        self.assertTrue(robokudo.is_robokudo_running())
+        self.assertEqual(mock_get_node_names.call_count, 1)
+
+    @patch('pycram.external_interfaces.robokudo.time.monotonic')
+    @patch('pycram.external_interfaces.robokudo.get_node_names')
+    def test_node_check_is_repeated_after_interval(self, mock_get_node_names, mock_monotonic):
+        mock_get_node_names.side_effect = [['/robokudo'], []]
+        mock_monotonic.side_effect = [100.0, 100.0 + robokudo.ROBOKUDO_NODE_CHECK_INTERVAL]
+        self.assertTrue(robokudo.is_robokudo_running())
+        self.assertFalse(robokudo.is_robokudo_running())
+        self.assertEqual(mock_get_node_names.call_count, 2)
+
+
+@patch('pycram.external_interfaces.robokudo.QueryGoal', MagicMock, create=True)
+@patch('pycram.external_interfaces.robokudo.is_robokudo_running', MagicMock(return_value=True))
+@patch('pycram.external_interfaces.robokudo.is_init', True)
+class RobokudoSendQueryTestCase(unittest.TestCase):
+
+    @patch('pycram.external_interfaces.robokudo.client')
+    def test_send_query_without_feedback(self, mock_client):
+        result = robokudo.send_query(obj_type='milk')
+
+        mock_client.send_goal.assert_called_once()
+        args, kwargs = mock_client.send_goal.call_args
+        self.assertEqual(args[0].obj.type, 'milk')
+        self.assertEqual(kwargs, {})
+        mock_client.wait_for_result.assert_called_once()
+        self.assertEqual(result, mock_client.get_result.return_value)
+
+    @patch('pycram.external_interfaces.robokudo.client')
+    def test_send_query_with_feedback(self, mock_client):
+        query_result = MagicMock()
+
+        def finish_goal():
+            mock_client.send_goal.call_args.kwargs['done_cb']('SUCCEEDED', query_result)
+
+        mock_client.wait_for_result.side_effect = finish_goal
+        result = robokudo.send_query(region='kitchen', with_feedback=True)
+
+        self.assertEqual(mock_client.send_goal.call_args.args[0].obj.location, 'kitchen')
+        self.assertEqual(set(mock_client.send_goal.call_args.kwargs), {'done_cb', 'active_cb', 'feedback_cb'})
+        mock_client.get_result.assert_not_called()
+        self.assertIs(result, query_result)